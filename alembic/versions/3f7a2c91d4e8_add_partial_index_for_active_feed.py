@@ -0,0 +1,42 @@
+"""add partial index for active feed
+
+Revision ID: 3f7a2c91d4e8
+Revises: c71c10fd8410
+Create Date: 2026-10-19 10:12:41.518230
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f7a2c91d4e8'
+down_revision: Union[str, Sequence[str], None] = 'c71c10fd8410'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Feed: WHERE is_active ORDER BY created_at DESC, id DESC with a
+    # (created_at, id) keyset cursor -> one ordered index range scan.
+    op.create_index(
+        "idx_posts_active_feed",
+        "posts",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("is_active"),
+    )
+
+    # Feed image aggregation looks images up per post
+    op.create_index(
+        "idx_post_images_post_id",
+        "post_images",
+        ["post_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_post_images_post_id", table_name="post_images")
+    op.drop_index("idx_posts_active_feed", table_name="posts")
@@ -0,0 +1,45 @@
+"""add posts search vector
+
+Revision ID: 5ac3e8f21b96
+Revises: e4c09a7b3d12
+Create Date: 2026-10-19 13:26:08.941572
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5ac3e8f21b96'
+down_revision: Union[str, Sequence[str], None] = 'e4c09a7b3d12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(category, '')), 'C')",
+            persisted=True
+        ),
+    ))
+
+    op.create_index(
+        "idx_posts_search_vector",
+        "posts",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_posts_search_vector", table_name="posts")
+    op.drop_column('posts', 'search_vector')
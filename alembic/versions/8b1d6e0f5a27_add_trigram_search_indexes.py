@@ -0,0 +1,45 @@
+"""add trigram search indexes
+
+Revision ID: 8b1d6e0f5a27
+Revises: 3f7a2c91d4e8
+Create Date: 2026-10-19 11:03:17.204915
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1d6e0f5a27'
+down_revision: Union[str, Sequence[str], None] = '3f7a2c91d4e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # GIN trigram indexes serve ILIKE '%q%' and similarity() ranking
+    op.create_index(
+        "idx_skills_name_trgm",
+        "skills",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+    op.create_index(
+        "idx_posts_category_trgm",
+        "posts",
+        ["category"],
+        postgresql_using="gin",
+        postgresql_ops={"category": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_posts_category_trgm", table_name="posts")
+    op.drop_index("idx_skills_name_trgm", table_name="skills")
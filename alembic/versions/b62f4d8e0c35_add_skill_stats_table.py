@@ -0,0 +1,57 @@
+"""add skill stats table
+
+Revision ID: b62f4d8e0c35
+Revises: 5ac3e8f21b96
+Create Date: 2026-10-19 14:05:33.117604
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b62f4d8e0c35'
+down_revision: Union[str, Sequence[str], None] = '5ac3e8f21b96'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'skill_stats',
+        sa.Column(
+            'skill_id',
+            sa.Integer(),
+            sa.ForeignKey('skills.id', ondelete='CASCADE'),
+            primary_key=True
+        ),
+        sa.Column('total_accounts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_posts', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    # Backfill; DISTINCT because user_skills may still hold duplicate pairs
+    op.execute("""
+        INSERT INTO skill_stats (skill_id, total_accounts, total_posts)
+        SELECT
+            s.id,
+            (
+                SELECT COUNT(DISTINCT us.user_id)
+                FROM user_skills us
+                JOIN users u ON u.id = us.user_id
+                WHERE us.skill_id = s.id AND u.is_active
+            ),
+            (
+                SELECT COUNT(DISTINCT p.id)
+                FROM posts p
+                JOIN user_skills us ON us.user_id = p.created_by
+                WHERE us.skill_id = s.id AND p.is_active
+            )
+        FROM skills s
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('skill_stats')
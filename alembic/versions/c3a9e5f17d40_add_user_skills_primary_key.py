@@ -0,0 +1,52 @@
+"""add user_skills primary key
+
+Revision ID: c3a9e5f17d40
+Revises: b62f4d8e0c35
+Create Date: 2026-10-19 15:12:48.402196
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9e5f17d40'
+down_revision: Union[str, Sequence[str], None] = 'b62f4d8e0c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows with a missing side never matched any join
+    op.execute("DELETE FROM user_skills WHERE user_id IS NULL OR skill_id IS NULL")
+
+    # Keep one physical row per (user_id, skill_id)
+    op.execute("""
+        DELETE FROM user_skills a
+        USING user_skills b
+        WHERE a.user_id = b.user_id
+          AND a.skill_id = b.skill_id
+          AND a.ctid > b.ctid
+    """)
+
+    op.alter_column('user_skills', 'user_id', existing_type=sa.Integer(), nullable=False)
+    op.alter_column('user_skills', 'skill_id', existing_type=sa.Integer(), nullable=False)
+
+    # PK serves "skills of a user" (selectin load, profile diff);
+    # the reverse index serves "users of a skill" (skill pages, stats)
+    op.create_primary_key('user_skills_pkey', 'user_skills', ['user_id', 'skill_id'])
+    op.create_index(
+        'ix_user_skills_skill_id_user_id',
+        'user_skills',
+        ['skill_id', 'user_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_skills_skill_id_user_id', table_name='user_skills')
+    op.drop_constraint('user_skills_pkey', 'user_skills', type_='primary')
+    op.alter_column('user_skills', 'skill_id', existing_type=sa.Integer(), nullable=True)
+    op.alter_column('user_skills', 'user_id', existing_type=sa.Integer(), nullable=True)
@@ -0,0 +1,64 @@
+"""add categories table
+
+Revision ID: e4c09a7b3d12
+Revises: 8b1d6e0f5a27
+Create Date: 2026-10-19 11:41:52.630118
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4c09a7b3d12'
+down_revision: Union[str, Sequence[str], None] = '8b1d6e0f5a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'categories',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('usage_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.UniqueConstraint('name', name='uq_categories_name'),
+    )
+    op.create_index('ix_categories_id', 'categories', ['id'])
+
+    # Backfill from existing posts, names normalized like
+    # CategoryService.normalize (trim, collapse spaces, lowercase)
+    op.execute("""
+        INSERT INTO categories (name, usage_count)
+        SELECT lower(btrim(regexp_replace(category, '\\s+', ' ', 'g'))), COUNT(*)
+        FROM posts
+        WHERE btrim(regexp_replace(category, '\\s+', ' ', 'g')) <> ''
+        GROUP BY 1
+    """)
+
+    op.create_index(
+        "idx_categories_name_trgm",
+        "categories",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+    # Autocomplete no longer searches posts.category
+    op.drop_index("idx_posts_category_trgm", table_name="posts")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "idx_posts_category_trgm",
+        "posts",
+        ["category"],
+        postgresql_using="gin",
+        postgresql_ops={"category": "gin_trgm_ops"},
+    )
+    op.drop_index("idx_categories_name_trgm", table_name="categories")
+    op.drop_index("ix_categories_id", table_name="categories")
+    op.drop_table('categories')
@@ -0,0 +1,38 @@
+"""normalize category names
+
+Revision ID: f18b2d6c9a53
+Revises: c3a9e5f17d40
+Create Date: 2026-10-19 17:41:06.229817
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f18b2d6c9a53'
+down_revision: Union[str, Sequence[str], None] = 'c3a9e5f17d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases backfilled before names were normalized hold "Web Dev",
+    # "web dev" and "web dev " as separate rows. Rebuild the dictionary
+    # from posts with the CategoryService.normalize rule.
+    op.execute("DELETE FROM categories")
+    op.execute("""
+        INSERT INTO categories (name, usage_count)
+        SELECT lower(btrim(regexp_replace(category, '\\s+', ' ', 'g'))), COUNT(*)
+        FROM posts
+        WHERE btrim(regexp_replace(category, '\\s+', ' ', 'g')) <> ''
+        GROUP BY 1
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Normalized names are valid under the old rule too
+    pass
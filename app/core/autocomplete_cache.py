@@ -0,0 +1,96 @@
+import json
+from typing import Optional
+
+from app.redis_client import redis_client
+
+
+class AutocompleteCache:
+    """
+    Redis cache for substring autocomplete results.
+
+    Entries are JSON ({"results": [...], "truncated": bool}), so names with
+    commas round-trip and empty result sets are cached too (negative
+    caching, shorter TTL).
+
+    Because results are "names containing q", the answer for "react" is a
+    filter of the answer for "reac" as long as that one was not cut off by
+    the limit. A miss on the exact query therefore falls back to the longest
+    cached, non-truncated prefix, fetched in the same MGET.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int = 300,
+        empty_ttl: int = 60,
+        min_length: int = 3
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.empty_ttl = empty_ttl
+        self.min_length = min_length
+
+    def _key(self, query: str) -> str:
+        return f"autocomplete:{self.namespace}:{query}"
+
+    def _metrics_key(self) -> str:
+        return f"autocomplete:metrics:{self.namespace}"
+
+    def _record(self, outcome: str):
+        redis_client.hincrby(self._metrics_key(), outcome, 1)
+
+    def get(self, query: str) -> Optional[list[str]]:
+        q = query.lower()
+
+        # Exact key first, then shorter prefixes down to min_length
+        prefixes = [q[:n] for n in range(len(q), self.min_length - 1, -1)]
+        values = redis_client.mget([self._key(p) for p in prefixes])
+
+        if values and values[0] is not None:
+            self._record("hit")
+            return json.loads(values[0])["results"]
+
+        for value in values[1:]:
+            if value is None:
+                continue
+
+            entry = json.loads(value)
+            if entry["truncated"]:
+                continue
+
+            # Keep prefix matches of the longer query ahead of the rest
+            results = sorted(
+                (r for r in entry["results"] if q in r.lower()),
+                key=lambda r: not r.lower().startswith(q)
+            )
+            self._store(q, results, truncated=False)
+            self._record("derived")
+            return results
+
+        self._record("miss")
+        return None
+
+    def set(self, query: str, results: list[str], limit: int):
+        self._store(query.lower(), results, truncated=len(results) >= limit)
+
+    def _store(self, q: str, results: list[str], truncated: bool):
+        redis_client.setex(
+            self._key(q),
+            self.ttl if results else self.empty_ttl,
+            json.dumps({"results": results, "truncated": truncated})
+        )
+
+    def metrics(self) -> dict:
+        counts = {
+            outcome: int(count)
+            for outcome, count in redis_client.hgetall(self._metrics_key()).items()
+        }
+        hits = counts.get("hit", 0) + counts.get("derived", 0)
+        total = hits + counts.get("miss", 0)
+
+        return {
+            "hit": counts.get("hit", 0),
+            "derived": counts.get("derived", 0),
+            "miss": counts.get("miss", 0),
+            "hit_ratio": round(hits / total, 4) if total else None,
+        }
@@ -4,9 +4,25 @@ from typing import List
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # Connections per worker process. Requests hold one; fan-out endpoints
+    # (skill page, unified search) borrow up to DB_FAN_OUT_LIMIT more at a
+    # time, shared by all requests of the worker. 0 = half of DB_POOL_SIZE.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_FAN_OUT_LIMIT: int = 0
 
     SECRET_KEY: str
     ALGORITHM: str
+
+    # "jose" (python-jose) or "pyjwt" (PyJWT, faster; optional dependency)
+    JWT_BACKEND: str = "jose"
+    # Verified access-token claims kept in-process, per worker
+    ACCESS_TOKEN_CACHE_SIZE: int = 10000
+
+    # Asymmetric signing (ALGORITHM = RS256 / EdDSA): key files and the kid
+    # used for new tokens, see app/core/jwt_keys.py. EdDSA needs pyjwt.
+    JWT_KEYS_DIR: str = ""
+    JWT_ACTIVE_KID: str = ""
     REDIRECT_URI: str
 
     GOOGLE_CLIENT_ID: str
@@ -28,6 +44,18 @@ class Settings(BaseSettings):
 
     ALLOWED_ORIGINS: str
 
+    # Password hashing process pool size, per uvicorn worker; 0 = CPU cores
+    # divided by WEB_CONCURRENCY (the uvicorn worker count, default 1)
+    PASSWORD_HASH_WORKERS: int = 0
+
+    # Password hash cost, tune with `python -m app.core.hash_calibration`.
+    # Hashes below these parameters are upgraded on the next login.
+    PASSWORD_HASH_SCHEME: str = "bcrypt"  # bcrypt | argon2
+    BCRYPT_ROUNDS: int = 12
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_TIME_COST: int = 3
+    ARGON2_PARALLELISM: int = 4
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,83 @@
+"""
+Pick the password hash cost that fits a target verify latency on this
+machine.
+
+    python -m app.core.hash_calibration --target-ms 250
+    python -m app.core.hash_calibration --scheme argon2 --target-ms 250 --memory-cost 65536
+
+Prints the settings to put in .env.
+"""
+import argparse
+import statistics
+import time
+
+from passlib.context import CryptContext
+
+
+SAMPLE_PASSWORD = "calibration-password"
+
+
+def _verify_ms(context: CryptContext, samples: int) -> float:
+    hashed = context.hash(SAMPLE_PASSWORD)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify(SAMPLE_PASSWORD, hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt(target_ms: float, samples: int) -> int:
+    best = 4
+    for rounds in range(4, 32):
+        context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+        elapsed = _verify_ms(context, samples)
+        print(f"bcrypt rounds={rounds}: {elapsed:.1f} ms")
+        if elapsed > target_ms:
+            break
+        best = rounds
+    return best
+
+
+def calibrate_argon2(target_ms: float, samples: int, memory_cost: int, parallelism: int) -> int:
+    best = 1
+    for time_cost in range(1, 33):
+        context = CryptContext(
+            schemes=["argon2"],
+            argon2__memory_cost=memory_cost,
+            argon2__rounds=time_cost,
+            argon2__parallelism=parallelism,
+        )
+        elapsed = _verify_ms(context, samples)
+        print(f"argon2 time_cost={time_cost}: {elapsed:.1f} ms")
+        if elapsed > target_ms:
+            break
+        best = time_cost
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default="bcrypt")
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--memory-cost", type=int, default=65536, help="argon2, KiB")
+    parser.add_argument("--parallelism", type=int, default=4, help="argon2 lanes")
+    args = parser.parse_args()
+
+    if args.scheme == "bcrypt":
+        rounds = calibrate_bcrypt(args.target_ms, args.samples)
+        print(f"\nPASSWORD_HASH_SCHEME={args.scheme}")
+        print(f"BCRYPT_ROUNDS={rounds}")
+    else:
+        time_cost = calibrate_argon2(
+            args.target_ms, args.samples, args.memory_cost, args.parallelism
+        )
+        print(f"\nPASSWORD_HASH_SCHEME={args.scheme}")
+        print(f"ARGON2_MEMORY_COST={args.memory_cost}")
+        print(f"ARGON2_TIME_COST={time_cost}")
+        print(f"ARGON2_PARALLELISM={args.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,106 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
 from passlib.context import CryptContext
 
-bcrypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+
+SUPPORTED_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_context(
+    scheme: str = settings.PASSWORD_HASH_SCHEME,
+    bcrypt_rounds: int = settings.BCRYPT_ROUNDS,
+    argon2_memory_cost: int = settings.ARGON2_MEMORY_COST,
+    argon2_time_cost: int = settings.ARGON2_TIME_COST,
+    argon2_parallelism: int = settings.ARGON2_PARALLELISM,
+) -> CryptContext:
+    if scheme not in SUPPORTED_SCHEMES:
+        raise ValueError(f"Unsupported password hash scheme: {scheme}")
+
+    # Configured scheme first (used for new hashes), the others stay
+    # verifiable but deprecated so needs_update() flags them. min_rounds
+    # makes hashes below the configured cost count as outdated too.
+    return CryptContext(
+        schemes=[scheme] + [s for s in SUPPORTED_SCHEMES if s != scheme],
+        deprecated="auto",
+        bcrypt__rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__rounds=argon2_time_cost,
+        argon2__min_rounds=argon2_time_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
+bcrypt_context = build_context()
+
+
+# bcrypt is pure CPU (~100-300 ms per call). Running it in a process pool
+# keeps it off the event loop and out of the GIL, so logins scale with
+# cores instead of serializing in one worker. Module-level functions so
+# they pickle by reference.
+def _hash(password: str) -> str:
+    return bcrypt_context.hash(password)
+
+
+def _verify(password: str, hashed: str) -> bool:
+    return bcrypt_context.verify(password, hashed)
+
+
+def _verify_and_update(password: str, hashed: str) -> tuple[bool, Optional[str]]:
+    return bcrypt_context.verify_and_update(password, hashed)
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _pool_size() -> int:
+    if settings.PASSWORD_HASH_WORKERS:
+        return settings.PASSWORD_HASH_WORKERS
+    # Every uvicorn worker has its own pool; share the cores between them
+    # (WEB_CONCURRENCY is what `uvicorn --workers` defaults from)
+    web_workers = int(os.environ.get("WEB_CONCURRENCY", "1")) or 1
+    return max(1, (os.cpu_count() or 1) // web_workers)
+
+
+def start_pool():
+    # forkserver (spawn where unavailable): children never fork from this
+    # process, which already runs threads (pub/sub listener, threadpool)
+    global _pool
+    if _pool is None:
+        methods = multiprocessing.get_all_start_methods()
+        method = "forkserver" if "forkserver" in methods else "spawn"
+        _pool = ProcessPoolExecutor(
+            max_workers=_pool_size(),
+            mp_context=multiprocessing.get_context(method)
+        )
+    return _pool
+
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def _run(fn, *args):
+    pool = start_pool()
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); a broken pool rejects every later
+        # call, so replace it once and retry on the fresh one
+        if _pool is pool:
+            shutdown_pool()
+        return await loop.run_in_executor(start_pool(), fn, *args)
+
 
 class Hash:
     @staticmethod
@@ -10,3 +110,20 @@ class Hash:
     @staticmethod
     def verify(password: str, hashed: str):
         return bcrypt_context.verify(password, hashed)
+
+    @staticmethod
+    async def hash_async(password: str) -> str:
+        return await _run(_hash, password)
+
+    @staticmethod
+    async def verify_async(password: str, hashed: str) -> bool:
+        return await _run(_verify, password, hashed)
+
+    @staticmethod
+    async def verify_and_update_async(
+        password: str,
+        hashed: str
+    ) -> tuple[bool, Optional[str]]:
+        # (valid, new_hash); new_hash is set when the stored hash uses an
+        # outdated scheme or cost and should be replaced
+        return await _run(_verify_and_update, password, hashed)
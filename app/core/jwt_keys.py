@@ -0,0 +1,103 @@
+import base64
+import logging
+from pathlib import Path
+from typing import Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+
+def _b64url_uint(value: int) -> str:
+    raw = value.to_bytes((value.bit_length() + 7) // 8 or 1, "big")
+    return _b64url(raw)
+
+
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+class JWTKeySet:
+    """
+    Asymmetric signing keys for RS256 / EdDSA tokens.
+
+    Keys live in JWT_KEYS_DIR, one file per key, the file name is the kid:
+      <kid>.pem       private key (can sign and verify)
+      <kid>.pub.pem   public key only (retired key, verify only)
+
+    Rotation: add the new key file, wait for the JWKS max-age so verifiers
+    have it, switch JWT_ACTIVE_KID to it, and keep the old one (its .pub.pem
+    is enough) until every token it signed has expired.
+    """
+
+    def __init__(self, keys_dir: str, active_kid: str, algorithm: str):
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        # kid -> (key object for PyJWT, PEM string for python-jose)
+        self._private: dict[str, tuple[object, str]] = {}
+        self._public: dict[str, tuple[object, str]] = {}
+
+        for path in sorted(Path(keys_dir).glob("*.pem")):
+            data = path.read_bytes()
+            if path.name.endswith(".pub.pem"):
+                kid = path.name[:-len(".pub.pem")]
+                public = serialization.load_pem_public_key(data)
+            else:
+                kid = path.stem
+                key = serialization.load_pem_private_key(data, password=None)
+                self._private[kid] = (key, self._private_pem(key))
+                public = key.public_key()
+            self._public[kid] = (public, self._public_pem(public))
+
+        if active_kid not in self._private:
+            raise RuntimeError(
+                f"JWT_ACTIVE_KID '{active_kid}' has no private key in {keys_dir}"
+            )
+
+        logging.info(f"Loaded JWT keys {sorted(self._public)}, signing with {active_kid}")
+
+    @staticmethod
+    def _private_pem(key) -> str:
+        return key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ).decode()
+
+    @staticmethod
+    def _public_pem(key) -> str:
+        return key.public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode()
+
+    def signing_key(self, as_pem: bool) -> tuple[str, object]:
+        key, pem = self._private[self.active_kid]
+        return self.active_kid, pem if as_pem else key
+
+    def verification_key(self, kid: Optional[str], as_pem: bool):
+        if kid not in self._public:
+            return None
+        key, pem = self._public[kid]
+        return pem if as_pem else key
+
+    def _jwk(self, kid: str, key) -> dict:
+        jwk = {"kid": kid, "use": "sig", "alg": self.algorithm}
+
+        if isinstance(key, rsa.RSAPublicKey):
+            numbers = key.public_numbers()
+            jwk.update(kty="RSA", n=_b64url_uint(numbers.n), e=_b64url_uint(numbers.e))
+        elif isinstance(key, ed25519.Ed25519PublicKey):
+            raw = key.public_bytes(
+                serialization.Encoding.Raw,
+                serialization.PublicFormat.Raw
+            )
+            jwk.update(kty="OKP", crv="Ed25519", x=_b64url(raw))
+        else:
+            raise RuntimeError(f"Unsupported JWT key type for kid '{kid}'")
+
+        return jwk
+
+    def jwks(self) -> dict:
+        return {
+            "keys": [self._jwk(kid, key) for kid, (key, _) in self._public.items()]
+        }
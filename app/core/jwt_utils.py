@@ -1,6 +1,9 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException
 from jose import jwt, JWTError
+import hashlib
+import time
 import uuid
 import logging
 
@@ -10,6 +13,68 @@ from app.core.config import settings
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 
+ASYMMETRIC_ALGORITHMS = ("RS256", "RS384", "RS512", "EdDSA")
+
+if settings.JWT_BACKEND == "pyjwt":
+    import jwt as pyjwt
+elif settings.JWT_BACKEND != "jose":
+    raise RuntimeError(f"Unknown JWT_BACKEND: {settings.JWT_BACKEND}")
+
+if ALGORITHM == "EdDSA" and settings.JWT_BACKEND != "pyjwt":
+    raise RuntimeError("EdDSA signing requires JWT_BACKEND=pyjwt")
+
+# None for HS* (shared SECRET_KEY), otherwise the RS/EdDSA key set.
+# cryptography is only needed (and imported) for the asymmetric ones.
+if ALGORITHM in ASYMMETRIC_ALGORITHMS:
+    from app.core.jwt_keys import JWTKeySet
+    key_set = JWTKeySet(settings.JWT_KEYS_DIR, settings.JWT_ACTIVE_KID, ALGORITHM)
+else:
+    key_set = None
+
+_USE_PEM = settings.JWT_BACKEND == "jose"
+
+
+# ---------------- BACKEND ----------------
+def _encode(payload: dict) -> str:
+    key, headers = SECRET_KEY, None
+    if key_set:
+        kid, key = key_set.signing_key(as_pem=_USE_PEM)
+        headers = {"kid": kid}
+
+    if settings.JWT_BACKEND == "pyjwt":
+        return pyjwt.encode(payload, key, algorithm=ALGORITHM, headers=headers)
+    return jwt.encode(payload, key, algorithm=ALGORITHM, headers=headers)
+
+
+def _verification_key(token: str):
+    if not key_set:
+        return SECRET_KEY
+
+    if settings.JWT_BACKEND == "pyjwt":
+        kid = pyjwt.get_unverified_header(token).get("kid")
+    else:
+        kid = jwt.get_unverified_header(token).get("kid")
+
+    key = key_set.verification_key(kid, as_pem=_USE_PEM)
+    if key is None:
+        raise JWTError(f"Unknown signing key: {kid}")
+    return key
+
+
+def _decode(token: str) -> dict:
+    if settings.JWT_BACKEND == "pyjwt":
+        try:
+            return pyjwt.decode(
+                token, _verification_key(token), algorithms=[ALGORITHM]
+            )
+        except pyjwt.PyJWTError as e:
+            raise JWTError(str(e))
+    return jwt.decode(token, _verification_key(token), algorithms=[ALGORITHM])
+
+
+def get_jwks() -> dict:
+    return key_set.jwks() if key_set else {"keys": []}
+
 
 # ---------------- ACCESS TOKEN ----------------
 def create_access_token(
@@ -28,17 +93,19 @@ def create_access_token(
         "type": "access"
     }
 
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    return _encode(payload)
 
 
 # ---------------- REFRESH TOKEN ----------------
 def create_refresh_token(
     email: str,
     user_id: int,
-    expires_delta: timedelta
+    expires_delta: timedelta,
+    jti: str | None = None,
+    family: str | None = None
 ):
     expire = datetime.now(timezone.utc) + expires_delta
-    jti = uuid.uuid4().hex
+    jti = jti or uuid.uuid4().hex
     payload = {
         "email": email,
         "user_id": user_id,
@@ -47,7 +114,11 @@ def create_refresh_token(
         "jti": jti
     }
 
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    # Session (token family) the refresh token belongs to
+    if family:
+        payload["fam"] = family
+
+    return _encode(payload)
 
 
 # ---------------- EMAIL VERIFICATION ----------------
@@ -60,13 +131,13 @@ def create_email_verification_token(email: str):
         "type": "email_verification"
     }
 
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    return _encode(payload)
 
 
 # ---------------- GENERIC VERIFY ----------------
 def verify_token(token: str):
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode(token)
         return payload
     except JWTError:
         raise HTTPException(
@@ -85,4 +156,32 @@ def decode_access_token(token: str):
             detail="Invalid access token"
         )
 
-    return payload
\ No newline at end of file
+    return payload
+
+
+# ---------------- VERIFIED ACCESS TOKEN CACHE ----------------
+# sha256(token) -> (exp, claims). Repeat tokens skip signature
+# verification; entries never outlive the token's own exp.
+_access_cache: "OrderedDict[bytes, tuple[float, dict]]" = OrderedDict()
+
+
+def decode_access_token_cached(token: str):
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+
+    entry = _access_cache.get(key)
+    if entry is not None:
+        if entry[0] > now:
+            _access_cache.move_to_end(key)
+            return entry[1]
+        del _access_cache[key]
+
+    payload = decode_access_token(token)
+
+    exp = payload.get("exp")
+    if exp:
+        _access_cache[key] = (float(exp), payload)
+        if len(_access_cache) > settings.ACCESS_TOKEN_CACHE_SIZE:
+            _access_cache.popitem(last=False)
+
+    return payload
@@ -1,42 +1,59 @@
-import time
-from fastapi import HTTPException, Request
+import math
 from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response
 from app.redis_client import redis_client
 
 class RedisRateLimiter:
-    LUA_SCRIPT = Path("app/lua/token_bucket.lua").read_text()
+    # Registered once: redis-py sends EVALSHA and reloads the script on NOSCRIPT
+    SCRIPT = redis_client.register_script(
+        (Path(__file__).resolve().parent.parent / "lua" / "token_bucket.lua").read_text()
+    )
+
+    @staticmethod
+    def _headers(capacity: int, remaining: int, reset_ms: int) -> dict:
+        return {
+            "RateLimit-Limit": str(capacity),
+            "RateLimit-Remaining": str(remaining),
+            "RateLimit-Reset": str(math.ceil(reset_ms / 1000)),
+        }
 
     @staticmethod
     async def check(
             request: Request,
             key_prefix: str,
             capacity: int,
-            refill_rate: int
+            refill_rate: int,
+            response: Optional[Response] = None
     ):
         ip = request.client.host
         redis_key = f"rate:{key_prefix}:{ip}"
-        now = int(time.time())
-
-        allowed = redis_client.eval(
-            RedisRateLimiter.LUA_SCRIPT,
-            1,
-            redis_key,
-            capacity,
-            refill_rate,
-            now
+
+        allowed, remaining, retry_after_ms, reset_ms = RedisRateLimiter.SCRIPT(
+            keys=[redis_key],
+            args=[capacity, refill_rate]
         )
+        headers = RedisRateLimiter._headers(capacity, remaining, reset_ms)
 
         if allowed == 0:
+            headers["Retry-After"] = str(math.ceil(retry_after_ms / 1000))
             raise HTTPException(
                 status_code=429,
-                detail="Too many requests."
+                detail="Too many requests.",
+                headers=headers
             )
 
+        if response is not None:
+            response.headers.update(headers)
+
 class RateLimiter:
     def __init__(self, key_prefix: str, capacity: int, refill_rate: int):
         self.key_prefix = key_prefix
         self.capacity = capacity
         self.refill_rate = refill_rate
 
-    async def __call__(self, request: Request):
-        await RedisRateLimiter.check(request, self.key_prefix, self.capacity, self.refill_rate)
+    async def __call__(self, request: Request, response: Response):
+        await RedisRateLimiter.check(
+            request, self.key_prefix, self.capacity, self.refill_rate, response
+        )
@@ -0,0 +1,32 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any):
+    # orjson handles dict/list/datetime/enum/UUID natively; pydantic models
+    # are the only thing our services hand back that it does not know.
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson-backed JSON response.
+
+    Returning an instance directly from a route bypasses FastAPI's
+    response_model validation and jsonable_encoder pass, so use it where the
+    service has already built the payload (dicts or pydantic models).
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
@@ -0,0 +1,183 @@
+import heapq
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.skills import Skills
+from app.models.user_skills import user_skills
+from app.redis_client import redis_client
+
+
+class SkillAutocompleteIndex:
+    """
+    In-process autocomplete over the skills dictionary.
+
+    Names are kept normalized in a sorted list, so a prefix query is a
+    bisect plus a short forward scan; substring matches are a linear scan of
+    a few thousand short strings. Weights are the number of users per skill.
+
+    New skills are added incrementally and broadcast to every worker over
+    Redis pub/sub; weights are refreshed by a full reload every
+    REFRESH_INTERVAL seconds, run in a background thread so requests keep
+    reading the current snapshot meanwhile.
+    """
+
+    CHANNEL = "skills:index"
+    REFRESH_INTERVAL = 600  # seconds
+    RETRY_INTERVAL = 30     # after a failed reload
+
+    def __init__(self):
+        # (sorted names, name -> weight), replaced as a whole on write
+        self._snapshot: tuple[list[str], dict[str, int]] = ([], {})
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._reloading = threading.Lock()
+        self._listener = None
+        # Called with the names of every broadcast batch of new skills
+        self._subscribers: list = []
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return " ".join(name.lower().split())
+
+    # ---------------- BUILD ----------------
+    def load(self, db: Session):
+        rows = (
+            db.query(Skills.name, func.count(user_skills.c.user_id))
+            .outerjoin(user_skills, user_skills.c.skill_id == Skills.id)
+            .group_by(Skills.id, Skills.name)
+            .all()
+        )
+
+        weights = {}
+        for name, users in rows:
+            if name:
+                key = self.normalize(name)
+                weights[key] = weights.get(key, 0) + users
+
+        with self._lock:
+            # Readers keep iterating whichever snapshot they grabbed
+            self._snapshot = (sorted(weights), weights)
+            self._loaded_at = time.monotonic()
+
+    def refresh_in_background(self):
+        # Never blocks the caller; at most one reload runs at a time
+        if time.monotonic() - self._loaded_at <= self.REFRESH_INTERVAL:
+            return
+        if not self._reloading.acquire(blocking=False):
+            return
+        threading.Thread(target=self._reload, daemon=True).start()
+
+    def _reload(self):
+        db = SessionLocal()
+        try:
+            self.load(db)
+        except Exception as e:
+            logging.error(f"Skill index reload failed: {e}")
+            self._loaded_at = time.monotonic() - self.REFRESH_INTERVAL + self.RETRY_INTERVAL
+        finally:
+            db.close()
+            self._reloading.release()
+
+    def add(self, names: list[str], weight: int = 1):
+        with self._lock:
+            current_names, current_weights = self._snapshot
+            new_keys = {
+                key for key in map(self.normalize, names)
+                if key and key not in current_weights
+            }
+            if not new_keys:
+                return
+
+            new_names = current_names[:]
+            new_weights = dict(current_weights)
+            for key in new_keys:
+                insort(new_names, key)
+                new_weights[key] = weight
+
+            self._snapshot = (new_names, new_weights)
+
+    # ---------------- BROADCAST ----------------
+    def publish(self, names: list[str]):
+        if not names:
+            return
+
+        self.add(names)
+        try:
+            redis_client.publish(self.CHANNEL, json.dumps(names))
+        except Exception as e:
+            # Other workers catch up on their next periodic reload
+            logging.warning(f"Skill index broadcast failed: {e}")
+
+    def subscribe(self, callback):
+        self._subscribers.append(callback)
+
+    def _on_message(self, message):
+        try:
+            names = json.loads(message["data"])
+            self.add(names)
+        except (TypeError, ValueError):
+            logging.warning(f"Ignoring bad skill index message: {message}")
+            return
+
+        for callback in self._subscribers:
+            try:
+                callback(names)
+            except Exception as e:
+                logging.warning(f"Skill index subscriber failed: {e}")
+
+    def _on_listener_error(self, error, pubsub, thread):
+        # Without a handler the thread would die silently. The next
+        # get_message() reconnects and resubscribes; broadcasts missed
+        # meanwhile are picked up by a reload on the next query.
+        logging.warning(f"Skill index listener error, reconnecting: {error}")
+        self._loaded_at = 0.0
+        time.sleep(1)
+
+    def start_listener(self):
+        if self._listener is not None:
+            return
+
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self.CHANNEL: self._on_message})
+        self._listener = pubsub.run_in_thread(
+            sleep_time=1,
+            daemon=True,
+            exception_handler=self._on_listener_error
+        )
+
+    # ---------------- QUERY ----------------
+    def search(self, query: str, limit: int = 8) -> list[str]:
+        q = self.normalize(query)
+        if not q:
+            return []
+
+        names, weights = self._snapshot
+
+        prefix = []
+        i = bisect_left(names, q)
+        while i < len(names) and names[i].startswith(q):
+            prefix.append(names[i])
+            i += 1
+
+        results = heapq.nlargest(limit, prefix, key=weights.__getitem__)
+        if len(results) >= limit:
+            return results
+
+        substring = (
+            name for name in names
+            if q in name and not name.startswith(q)
+        )
+        results += heapq.nlargest(
+            limit - len(results), substring, key=weights.__getitem__
+        )
+        return results
+
+
+skill_index = SkillAutocompleteIndex()
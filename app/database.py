@@ -1,5 +1,7 @@
+import asyncio
 import logging
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
@@ -10,7 +12,12 @@ if os.getenv("DEBUG", "false").lower() == "true":
     logging.basicConfig()
     logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
 
-engine = create_engine(settings.DATABASE_URL, echo=False)
+engine = create_engine(
+    settings.DATABASE_URL,
+    echo=False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
 
 # autoflush=False: we control flushes manually (e.g. db.flush() before
 # reading auto-generated IDs) to avoid premature DB round-trips.
@@ -24,3 +31,31 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def run_in_session(fn, *args):
+    # Runs fn(db, *args) on its own session (and pooled connection); used
+    # to fan independent queries out over the threadpool.
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+
+# Concurrent fan-outs queue here, in the event loop, instead of on the
+# connection pool where a checkout blocks a thread for up to 30s and
+# starves plain requests of connections.
+_fan_out = asyncio.Semaphore(
+    settings.DB_FAN_OUT_LIMIT or max(1, settings.DB_POOL_SIZE // 2)
+)
+
+
+async def gather_in_sessions(*calls):
+    # calls: (fn, *args) tuples, each run as fn(db, *args) in the threadpool
+    # on its own session; results come back in order, like asyncio.gather.
+    async def run(fn, *args):
+        async with _fan_out:
+            return await run_in_threadpool(run_in_session, fn, *args)
+
+    return await asyncio.gather(*(run(*call) for call in calls))
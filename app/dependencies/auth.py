@@ -1,12 +1,12 @@
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import HTTPException, status, Depends
-from app.core.jwt_utils import decode_access_token
+from app.core.jwt_utils import decode_access_token_cached
 
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 async def get_current_user(token: str = Depends(oauth2_bearer)):
     try:
-        payload = decode_access_token(token)
+        payload = decode_access_token_cached(token)
 
         email = payload.get("email")
         user_id = payload.get("user_id")
@@ -0,0 +1,20 @@
+-- Rotate a refresh-token family: compare-and-set of the current jti.
+-- KEYS[1] = family hash, ARGV[1] = presented jti, ARGV[2] = new jti,
+-- ARGV[3] = family TTL in seconds.
+-- Returns 1 rotated, 0 family unknown/expired, -1 reuse (family revoked).
+local current = redis.call("HGET", KEYS[1], "jti")
+
+if not current then
+    return 0
+end
+
+if current ~= ARGV[1] then
+    -- An already-rotated token was replayed: kill the whole session
+    redis.call("DEL", KEYS[1])
+    return -1
+end
+
+redis.call("HSET", KEYS[1], "jti", ARGV[2])
+redis.call("EXPIRE", KEYS[1], tonumber(ARGV[3]))
+
+return 1
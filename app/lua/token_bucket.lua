@@ -1,7 +1,12 @@
+-- Token bucket, timed by the Redis server clock in milliseconds.
+-- KEYS[1] = bucket hash, ARGV[1] = capacity, ARGV[2] = refill rate (tokens/s)
+-- Returns {allowed (1/0), remaining tokens, retry after ms, ms until full}
 local key = KEYS[1]
 local capacity = tonumber(ARGV[1])
 local refill_rate = tonumber(ARGV[2])
-local now = tonumber(ARGV[3])
+
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
 
 local data = redis.call("HMGET", key, "tokens", "last_refill")
 local tokens = tonumber(data[1])
@@ -13,16 +18,22 @@ if tokens == nil then
 end
 
 local elapsed = math.max(0, now - last_refill)
-local refill = elapsed * refill_rate
-tokens = math.min(capacity, tokens + refill)
+tokens = math.min(capacity, tokens + elapsed * refill_rate / 1000)
 
-if tokens < 1 then
-    return 0
-end
+local allowed = 0
+local retry_after = 0
 
-tokens = tokens - 1
+if tokens >= 1 then
+    allowed = 1
+    tokens = tokens - 1
+
+    redis.call("HSET", key, "tokens", tokens, "last_refill", now)
+    -- Idle buckets are full again after this long, nothing to keep
+    redis.call("PEXPIRE", key, math.ceil(capacity / refill_rate * 1000))
+else
+    retry_after = math.ceil((1 - tokens) / refill_rate * 1000)
+end
 
-redis.call("HMSET", key, "tokens", tokens, "last_refill", now)
-redis.call("EXPIRE", key, 60)
+local reset = math.ceil((capacity - tokens) / refill_rate * 1000)
 
-return 1
+return {allowed, math.floor(tokens), retry_after, reset}
@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,9 +10,15 @@ from app.routers.search import router as search_router
 from app.routers.profile import router as profile_router
 from app.routers.notification import router as notification_router
 from app.core.config import settings
+from app.core.responses import FastJSONResponse
 from app.routers.skill_detail import router as skill_detail_router
+from app.routers.well_known import router as well_known_router
 from app.core.websocket_manager import manager
-app = FastAPI()
+from app.core.skill_index import skill_index
+from app.core.hashing import start_pool, shutdown_pool
+from app.services.skill_resolver_service import SkillResolverService
+from app.database import SessionLocal
+app = FastAPI(default_response_class=FastJSONResponse)
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -33,6 +41,33 @@ app.add_middleware(
 
 
 
+# ----- STARTUP -----
+@app.on_event("startup")
+def start_password_hash_pool():
+    start_pool()
+
+
+@app.on_event("startup")
+def load_skill_index():
+    # Other workers' new skills invalidate this worker's fuzzy matches
+    skill_index.subscribe(SkillResolverService.forget_local)
+
+    db = SessionLocal()
+    try:
+        skill_index.load(db)
+        skill_index.start_listener()
+    except Exception as e:
+        # Autocomplete loads it lazily on first use
+        logging.error(f"Failed to load skill index: {e}")
+    finally:
+        db.close()
+
+
+@app.on_event("shutdown")
+def stop_password_hash_pool():
+    shutdown_pool()
+
+
 # ----- HEALTH CHECK -----
 @app.get("/healthy")
 async def check_healthy():
@@ -46,6 +81,7 @@ app.include_router(search_router)
 app.include_router(profile_router)
 app.include_router(notification_router)
 app.include_router(skill_detail_router)
+app.include_router(well_known_router)
 
 
 @app.websocket("/ws/notifications/{user_id}")
@@ -4,3 +4,5 @@ from app.models.skills import Skills
 from app.models.user_skills import user_skills
 from app.models.post_response import PostResponse
 from app.models.notification import Notification
+from app.models.category import Category
+from app.models.skill_stats import SkillStats
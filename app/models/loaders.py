@@ -0,0 +1,40 @@
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.models.posts import Post
+from app.models.users import Users
+
+
+# Loader strategies shared by the services.
+#
+# Collections are always loaded with selectinload: one extra
+# SELECT ... WHERE post_id IN (...) per page instead of a JOIN that
+# multiplies rows (post x images) and forces LIMIT/OFFSET into a subquery.
+# Many-to-one relations (creator) stay on joinedload, they never duplicate.
+POST_WITH_IMAGES = (
+    selectinload(Post.images),
+)
+
+POST_WITH_CREATOR_AND_IMAGES = (
+    joinedload(Post.creator),
+    selectinload(Post.images),
+)
+
+
+# Column projections for list views. These skip ORM entity construction
+# (and the selectin load of Users.skills) entirely.
+POST_LIST_COLUMNS = (
+    Post.id,
+    Post.title,
+    Post.description,
+    Post.category,
+    Post.duration,
+    Post.created_at,
+)
+
+POST_CREATOR_COLUMNS = (
+    Users.id.label("creator_id"),
+    Users.username.label("creator_username"),
+    Users.first_name.label("creator_first_name"),
+    Users.last_name.label("creator_last_name"),
+    Users.profile_image.label("creator_profile_image"),
+)
@@ -1,9 +1,18 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from datetime import datetime
 from app.database import Base
 
 
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
+
+# Weighted full-text document: title (A) > description (B) > category (C)
+POST_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(category, '')), 'C')"
+)
+
 
 class Post(Base):
     __tablename__ = "posts"
@@ -18,12 +27,17 @@ class Post(Base):
     is_active = Column(Boolean, default=True)
     application_count = Column(Integer, default=0, nullable=False)
 
+    # Generated by Postgres; deferred so regular Post loads never fetch it
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(POST_SEARCH_VECTOR, persisted=True))
+    )
+
     creator = relationship("Users", backref="posts")
 
     images = relationship(
         "PostImage",
         backref="post",
         cascade="all, delete-orphan",
-        lazy="joined"
+        lazy="selectin"
     )
 
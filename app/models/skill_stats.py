@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from app.database import Base
+
+
+class SkillStats(Base):
+    """
+    Per-skill counters maintained incrementally by SkillStatsService, so
+    skill pages read their totals without COUNT joins.
+    """
+    __tablename__ = "skill_stats"
+
+    skill_id = Column(
+        Integer,
+        ForeignKey("skills.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    # Active users having the skill
+    total_accounts = Column(Integer, default=0, nullable=False)
+
+    # Active posts created by users having the skill
+    total_posts = Column(Integer, default=0, nullable=False)
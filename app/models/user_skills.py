@@ -1,11 +1,13 @@
 from app.database import Base
-from sqlalchemy import Column, Integer, ForeignKey, Table
+from sqlalchemy import Column, Integer, ForeignKey, Table, Index
 
 
 user_skills = Table(
     "user_skills",
     Base.metadata,
-    Column("user_id", Integer, ForeignKey("users.id")),
-    Column("skill_id", Integer, ForeignKey("skills.id")),
+    Column("user_id", Integer, ForeignKey("users.id"), primary_key=True),
+    Column("skill_id", Integer, ForeignKey("skills.id"), primary_key=True),
 
-)
\ No newline at end of file
+    # Reverse lookup for skill pages; the PK covers the per-user side
+    Index("ix_user_skills_skill_id_user_id", "skill_id", "user_id"),
+)
@@ -1,6 +1,6 @@
 from fastapi import (
     APIRouter, Depends, Request,
-    Form, File, UploadFile, HTTPException
+    Form, File, UploadFile, HTTPException, Response
 )
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
@@ -11,8 +11,10 @@ from app.schemas.auth_schema import CreateUserRequest, VerifyOtpRequest, Refresh
     ForgotPasswordRequest, ResetPasswordRequest, UpdateMobileRequest
 from app.schemas.token_schema import Token
 from app.core.rate_limiter import RateLimiter
+from app.core.etag import make_etag, is_not_modified, not_modified, cache_headers
 
 from app.services.auth_service import AuthService
+from app.services.cache_version_service import CacheVersionService
 from app.services.oauth_service import OAuthService
 from app.services.password_service import PasswordService
 from app.services.profile_service import ProfileService
@@ -31,7 +33,7 @@ async def register(
     db: Session = Depends(get_db),
     _ = Depends(RateLimiter("auth:register", 5, 1))
 ):
-    return AuthService.create_user(payload, db)
+    return await AuthService.create_user(payload, db)
 
 
 # ---------------- LOGIN ----------------
@@ -41,7 +43,7 @@ async def login(
     db: Session = Depends(get_db),
     _ = Depends(RateLimiter("auth:login", 5, 1))
 ):
-    return AuthService.login(form_data, db)
+    return await AuthService.login(form_data, db)
 
 # ---------------- REFRESH ----------------
 @router.post("/refresh", response_model=Token)
@@ -165,26 +167,34 @@ async def reset_password(
 # Frontend needs it
 @router.get("/me")
 def get_me(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    user = db.query(Users).filter(
-        Users.id == current_user["user_id"]
-    ).first()
+    # Version is bumped by every profile write; a matching ETag means
+    # the client's copy is current and the DB is never touched.
+    version = CacheVersionService.get_user_version(current_user["user_id"])
+    etag = make_etag("me", current_user["user_id"], version)
 
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    response.headers.update(cache_headers(etag))
+
+    # Served from the Redis snapshot; the DB is only hit after a write
+    user = ProfileService.get_snapshot(db, current_user["user_id"], version)
 
     return {
         "user": {
-            "id": user.id,
-            "firstName": user.first_name,
-            "lastName": user.last_name,
-            "email": user.email,
-            "photoUrl": user.profile_image,
-            "bio": user.bio,
-            "interests": [skill.name for skill in user.skills],
-            "isVerified": user.is_verified,
+            "id": user["id"],
+            "firstName": user["first_name"],
+            "lastName": user["last_name"],
+            "email": user["email"],
+            "photoUrl": user["profile_image"],
+            "bio": user["bio"],
+            "interests": user["skills"],
+            "isVerified": user["is_verified"],
         }
     }
 
@@ -213,6 +223,8 @@ def update_mobile(
     user.mobile = payload.mobile
     db.commit()
 
+    CacheVersionService.bump_user_version(user.id)
+
     return {
         "message": "Mobile number updated successfully"
     }
\ No newline at end of file
@@ -1,11 +1,13 @@
-from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
+from app.core.etag import make_etag, is_not_modified, not_modified, cache_headers
+from app.core.responses import FastJSONResponse
 from app.database import get_db
 from app.dependencies.auth import get_current_user
 from app.services.feed_service import FeedService
+from app.services.feed_ranking_service import FeedRankingService
 
 router = APIRouter(
     prefix="/feed",
@@ -14,9 +16,34 @@ router = APIRouter(
 
 @router.get("/")
 def get_feed(
-    cursor: Optional[datetime] = Query(None),
+    request: Request,
+    cursor: Optional[str] = Query(None),
     limit: int = Query(20, le=50),
+    mode: str = Query("latest", pattern="^(latest|ranked)$"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    return FeedService.get_feed(cursor, limit, db, current_user)
+    head = FeedService.get_head(db)
+
+    if mode == "ranked":
+        # Tag the inputs the page is actually ranked from: a candidate set
+        # or user vector rebuilt since the client's copy changes the ETag.
+        candidates = FeedRankingService.get_candidates(db, str(head))
+        vector = FeedRankingService.get_user_vector(db, current_user["user_id"])
+        etag = make_etag(
+            "feed", mode, cursor, limit, candidates["built_at"], vector["built_at"]
+        )
+    else:
+        etag = make_etag("feed", mode, cursor, limit, head)
+
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    if mode == "ranked":
+        page = FeedRankingService.get_ranked_feed(
+            cursor, limit, candidates, vector, current_user
+        )
+    else:
+        page = FeedService.get_feed(cursor, limit, db, current_user)
+
+    return FastJSONResponse(page, headers=cache_headers(etag))
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
+from app.core.responses import FastJSONResponse
 from app.database import get_db
 from app.dependencies.auth import get_current_user
 from app.services.notification_service import NotificationService
@@ -23,7 +24,7 @@ def get_notifications(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    return NotificationService.get_notifications(
+    notifications = NotificationService.get_notifications(
         db=db,
         user_id=current_user["user_id"],
         unread_only=unread_only,
@@ -31,6 +32,12 @@ def get_notifications(
         offset=offset,
     )
 
+    # Validate once here instead of response_model + jsonable_encoder
+    return FastJSONResponse([
+        NotificationResponse.model_validate(notification)
+        for notification in notifications
+    ])
+
 
 @router.get("/unread-count", response_model=UnreadCountResponse)
 def get_unread_count(
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, UploadFile, File, Form, Query
 from sqlalchemy.orm import Session
 
+from app.core.responses import FastJSONResponse
 from app.database import get_db
 from app.dependencies.auth import get_current_user
 from app.schemas.post_response import UpdateResponseStatusSchema, MyPostResponse
@@ -112,9 +113,10 @@ def read_my_posts(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
-    return PostService.get_my_posts(
+    # Service already builds MyPostResponse objects, skip re-validation
+    return FastJSONResponse(PostService.get_my_posts(
         db=db,
         user_id=current_user["user_id"],
         limit=limit,
         offset=offset
-    )
+    ))
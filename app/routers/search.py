@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, Request
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.core.autocomplete_cache import AutocompleteCache
 from app.core.rate_limiter import RedisRateLimiter
-from app.redis_client import redis_client
+from app.core.responses import FastJSONResponse
+from app.core.skill_index import skill_index
+from app.dependencies.auth import get_current_user
 from app.services.search_service import SearchService
 
 router = APIRouter(
@@ -10,12 +16,66 @@ router = APIRouter(
     tags=["Search"]
 )
 
+CATEGORY_AUTOCOMPLETE_LIMIT = 8
+category_cache = AutocompleteCache("category")
+
+
+@router.get("/")
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(5, ge=1, le=20)
+):
+    await RedisRateLimiter.check(
+        request=request,
+        key_prefix="search",
+        capacity=10,
+        refill_rate=5
+    )
+
+    result = await SearchService.search_all(q, limit)
+
+    return {
+        "query": q,
+        **result
+    }
+
+
+@router.get("/posts")
+async def search_posts(
+    request: Request,
+    q: str = Query(..., min_length=2, max_length=200),
+    category: Optional[str] = Query(None),
+    is_active: bool = Query(True),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    await RedisRateLimiter.check(
+        request=request,
+        key_prefix="search_posts",
+        capacity=10,
+        refill_rate=5
+    )
+
+    # Heaviest query on this router: keep it off the event loop
+    result = await run_in_threadpool(
+        SearchService.search_posts,
+        db,
+        q,
+        category=category,
+        is_active=is_active,
+        cursor=cursor,
+        limit=limit
+    )
+
+    return FastJSONResponse(result)
+
 
 @router.get("/skills/autocomplete")
 async def autocomplete_skills(
     request: Request,
-    query: str,
-    db: Session = Depends(get_db)
+    query: str
 ):
     # Safety check
     if len(query) < 3:
@@ -28,18 +88,11 @@ async def autocomplete_skills(
         refill_rate=5     # tokens/sec
     )
 
-    cache_key = f"skills:autocomplete:{query.lower()}"
+    # Served from the in-process index, no Redis or DB round trip; a due
+    # weight refresh runs in the background
+    skill_index.refresh_in_background()
 
-    cached = redis_client.get(cache_key)
-    if cached:
-        return cached.split(",")
-
-    skills = SearchService.search_skills(db, query)
-    results = [s.name for s in skills]
-
-    redis_client.setex(cache_key, 300, ",".join(results))
-
-    return results
+    return skill_index.search(query)
 
 
 @router.get("/category/autocomplete/")
@@ -59,16 +112,26 @@ async def autocomplete_category(
         refill_rate=5
     )
 
-    cache_key = f"category:autocomplete:{query.lower()}"
-
-    cached = redis_client.get(cache_key)
-    if cached:
-        return cached.split(",")
+    cached = category_cache.get(query)
+    if cached is not None:
+        return cached
 
-    categories = SearchService.search_category(db, query)
-    results = [s.category for s in categories]
+    categories = SearchService.search_category(
+        db, query, CATEGORY_AUTOCOMPLETE_LIMIT
+    )
+    results = [c.name for c in categories]
 
-    redis_client.setex(cache_key, 300, ",".join(results))
+    category_cache.set(query, results, CATEGORY_AUTOCOMPLETE_LIMIT)
 
     return results
 
+
+# Operational data, not for anonymous clients
+@router.get("/autocomplete/metrics")
+async def autocomplete_metrics(
+    current_user: dict = Depends(get_current_user)
+):
+    return {
+        "category": category_cache.metrics()
+    }
+
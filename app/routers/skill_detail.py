@@ -1,7 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.core.etag import make_etag, is_not_modified, not_modified, cache_headers
 from app.core.rate_limiter import RedisRateLimiter
+from app.core.responses import FastJSONResponse
+from app.services.cache_version_service import CacheVersionService
 from app.services.skill_detail_service import SkillDetailService
 
 router = APIRouter(
@@ -46,7 +49,15 @@ async def get_skill_details(
         refill_rate=15
     )
 
-    result = SkillDetailService.get_skill_details(db, skill_name)
+    # Skills version is bumped whenever a profile or post changes what a
+    # skill page shows, so a match skips the queries entirely.
+    version = CacheVersionService.get_skills_version()
+    etag = make_etag("skill", skill_name.lower(), version)
+
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    result = await SkillDetailService.get_skill_details(db, skill_name, version)
 
     if not result.get("found"):
         raise HTTPException(
@@ -54,7 +65,7 @@ async def get_skill_details(
             detail=f"Skill '{skill_name}' not found"
         )
 
-    return result
+    return FastJSONResponse(result, headers=cache_headers(etag))
 
 
 @router.get("/{skill_name}/accounts")
@@ -106,4 +117,4 @@ async def get_skill_posts(
             detail=f"No posts found for skill '{skill_name}'"
         )
 
-    return result
\ No newline at end of file
+    return FastJSONResponse(result)
\ No newline at end of file
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+
+from app.core.jwt_utils import get_jwks
+from app.core.responses import FastJSONResponse
+
+router = APIRouter(
+    prefix="/.well-known",
+    tags=["Well-known"]
+)
+
+
+@router.get("/jwks.json")
+async def jwks():
+    # Public keys only. Long-lived: a new key is published for at least
+    # this long before it starts signing (see app/core/jwt_keys.py).
+    return FastJSONResponse(
+        get_jwks(),
+        headers={"Cache-Control": "public, max-age=86400, stale-while-revalidate=3600"}
+    )
@@ -22,33 +22,3 @@ class PostResponse(BaseModel):
 
     class Config:
         from_attributes = True
-
-class FeedCreator(BaseModel):
-    id: Optional[int]
-    username: Optional[str]
-    profile_photo: Optional[str]
-
-    class Config:
-        from_attributes = True
-
-class FeedPostResponse(BaseModel):
-    id: int
-    title: str
-    description: str
-    category: str
-    duration: Optional[str]
-    images: List[str]
-    creator: FeedCreator
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
-
-class FeedPagination(BaseModel):
-    limit: int
-    has_next: bool
-    next_cursor: Optional[str]
-
-class FeedResponse(BaseModel):
-    posts: List[FeedPostResponse]
-    pagination: FeedPagination
@@ -1,5 +1,7 @@
 import secrets
+import uuid
 from datetime import timedelta
+from pathlib import Path
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
@@ -8,13 +10,44 @@ from app.models.users import Users
 from app.redis_client import redis_client
 from app.core.hashing import Hash
 from app.core.jwt_utils import create_access_token, create_refresh_token, verify_token
+from app.services.cache_version_service import CacheVersionService
 from app.services.email_service import EmailService
 
 
+# Compare-and-set rotation of a refresh-token family, see the script
+_rotate_refresh_family = redis_client.register_script(
+    (Path(__file__).resolve().parent.parent / "lua" / "refresh_rotate.lua").read_text()
+)
+
+
 class AuthService:
 
+    REFRESH_TTL = timedelta(days=7)
+
+    # One hash per session: {"jti": current refresh jti, "user_id": ...}
+    REFRESH_FAMILY_KEY = "refresh_family:{family}"
+
     @staticmethod
-    def create_user(req, db: Session):
+    def _start_refresh_family(user: Users) -> str:
+        family = uuid.uuid4().hex
+        jti = uuid.uuid4().hex
+        key = AuthService.REFRESH_FAMILY_KEY.format(family=family)
+
+        pipe = redis_client.pipeline()
+        pipe.hset(key, mapping={"jti": jti, "user_id": user.id})
+        pipe.expire(key, AuthService.REFRESH_TTL)
+        pipe.execute()
+
+        return create_refresh_token(
+            email=user.email,
+            user_id=user.id,
+            expires_delta=AuthService.REFRESH_TTL,
+            jti=jti,
+            family=family
+        )
+
+    @staticmethod
+    async def create_user(req, db: Session):
         existing = db.query(Users).filter(Users.email == req.email).first()
 
         # Case 1: Already verified → hard stop
@@ -32,7 +65,7 @@ class AuthService:
                 username=None,
                 first_name=req.firstName,
                 last_name=req.lastName,
-                hashed_password=Hash.hash(req.password),
+                hashed_password=await Hash.hash_async(req.password),
                 is_active=True,
                 is_verified=False,
             )
@@ -59,15 +92,23 @@ class AuthService:
         }
 
     @staticmethod
-    def login(form_data: OAuth2PasswordRequestForm, db: Session):
+    async def login(form_data: OAuth2PasswordRequestForm, db: Session):
         user = db.query(Users).filter(Users.email == form_data.username).first()
 
         if not user or not user.hashed_password:
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
-        if not Hash.verify(form_data.password, user.hashed_password):
+        valid, new_hash = await Hash.verify_and_update_async(
+            form_data.password, user.hashed_password
+        )
+        if not valid:
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
+        # Transparent upgrade to the configured scheme / cost
+        if new_hash:
+            user.hashed_password = new_hash
+            db.commit()
+
         if not user.is_verified:
             raise HTTPException(status_code=403, detail="Email not verified")
 
@@ -77,12 +118,7 @@ class AuthService:
             expires_delta=timedelta(minutes=30)
         )
 
-
-        refresh_token = create_refresh_token(
-            email=user.email,
-            user_id=user.id,
-            expires_delta=timedelta(days=7)
-        )
+        refresh_token = AuthService._start_refresh_family(user)
 
         return {
             "access_token": access_token,
@@ -106,6 +142,7 @@ class AuthService:
 
         user.is_verified = True
         db.commit()
+        CacheVersionService.bump_user_version(user.id)
 
         redis_client.delete(f"email_otp:{email}")
         redis_client.delete(f"email_otp_resend:{email}")
@@ -117,11 +154,7 @@ class AuthService:
             expires_delta=timedelta(minutes=120)
         )
 
-        refresh_token = create_refresh_token(
-            email=user.email,
-            user_id=user.id,
-            expires_delta=timedelta(days=7)
-        )
+        refresh_token = AuthService._start_refresh_family(user)
 
         print(token)
 
@@ -169,7 +202,11 @@ class AuthService:
             raise HTTPException(status_code=401, detail="Invalid token type")
 
         jti = payload.get("jti")
-        if jti and redis_client.exists(f"blacklisted_jti:{jti}"):
+        family = payload.get("fam")
+
+        # Tokens issued before families existed: one-shot blacklist, then
+        # the client moves onto a family below. Gone after REFRESH_TTL.
+        if not family and jti and redis_client.exists(f"blacklisted_jti:{jti}"):
             raise HTTPException(status_code=401, detail="Token has already been used")
 
         user_id = payload.get("user_id")
@@ -178,9 +215,33 @@ class AuthService:
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        # Blacklist the old refresh token
-        if jti:
-            redis_client.set(f"blacklisted_jti:{jti}", "1", ex=timedelta(days=7))
+        if family:
+            new_jti = uuid.uuid4().hex
+            rotated = _rotate_refresh_family(
+                keys=[AuthService.REFRESH_FAMILY_KEY.format(family=family)],
+                args=[jti, new_jti, int(AuthService.REFRESH_TTL.total_seconds())]
+            )
+
+            if rotated == 0:
+                raise HTTPException(status_code=401, detail="Session expired or revoked")
+
+            if rotated == -1:
+                raise HTTPException(
+                    status_code=401,
+                    detail="Refresh token reuse detected, session revoked"
+                )
+
+            new_refresh_token = create_refresh_token(
+                email=user.email,
+                user_id=user.id,
+                expires_delta=AuthService.REFRESH_TTL,
+                jti=new_jti,
+                family=family
+            )
+        else:
+            if jti:
+                redis_client.set(f"blacklisted_jti:{jti}", "1", ex=AuthService.REFRESH_TTL)
+            new_refresh_token = AuthService._start_refresh_family(user)
 
         new_access_token = create_access_token(
             email=user.email,
@@ -188,12 +249,6 @@ class AuthService:
             expires_delta=timedelta(minutes=30)
         )
 
-        new_refresh_token = create_refresh_token(
-            email=user.email,
-            user_id=user.id,
-            expires_delta=timedelta(days=7)
-        )
-
         return {
             "access_token": new_access_token,
             "refresh_token": new_refresh_token,
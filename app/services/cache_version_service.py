@@ -0,0 +1,53 @@
+import time
+
+from app.redis_client import redis_client
+
+
+class CacheVersionService:
+    """
+    Monotonic version counters in Redis used to build ETags and to key
+    cached snapshots. A missing counter is seeded from the clock (ms) so a
+    counter lost to eviction never hands out a version seen before.
+    """
+
+    USER_KEY = "version:user:{user_id}"
+    SKILLS_KEY = "version:skills"
+
+    @staticmethod
+    def _seed() -> int:
+        return int(time.time() * 1000)
+
+    @staticmethod
+    def _get(key: str) -> int:
+        version = redis_client.get(key)
+        if version is None:
+            redis_client.set(key, CacheVersionService._seed(), nx=True)
+            version = redis_client.get(key)
+        return int(version)
+
+    @staticmethod
+    def _bump(key: str):
+        pipe = redis_client.pipeline()
+        pipe.set(key, CacheVersionService._seed(), nx=True)
+        pipe.incr(key)
+        pipe.execute()
+
+    @staticmethod
+    def get_user_version(user_id: int) -> int:
+        return CacheVersionService._get(
+            CacheVersionService.USER_KEY.format(user_id=user_id)
+        )
+
+    @staticmethod
+    def bump_user_version(user_id: int):
+        CacheVersionService._bump(
+            CacheVersionService.USER_KEY.format(user_id=user_id)
+        )
+
+    @staticmethod
+    def get_skills_version() -> int:
+        return CacheVersionService._get(CacheVersionService.SKILLS_KEY)
+
+    @staticmethod
+    def bump_skills_version():
+        CacheVersionService._bump(CacheVersionService.SKILLS_KEY)
@@ -0,0 +1,27 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.category import Category
+
+
+class CategoryService:
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        # "Web  Dev " and "web dev" are one dictionary entry
+        return " ".join(name.split()).lower()
+
+    @staticmethod
+    def record_usage(db: Session, name: str):
+        # Upsert in the caller's transaction: new category starts at 1,
+        # existing one is incremented atomically (no read-modify-write).
+        name = CategoryService.normalize(name)
+        if not name:
+            return
+
+        stmt = insert(Category).values(name=name, usage_count=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Category.name],
+            set_={"usage_count": Category.usage_count + 1}
+        )
+        db.execute(stmt)
@@ -0,0 +1,223 @@
+import heapq
+import json
+import time
+from collections import Counter
+from datetime import timezone
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.models import Post
+from app.models.post_response import PostResponse
+from app.models.user_skills import user_skills
+from app.redis_client import redis_client
+from app.services.feed_service import FeedService
+
+
+class FeedRankingService:
+    """
+    Personalized feed: recent active posts ranked by how well the creator's
+    skills overlap the viewer's, the viewer's category affinity and recency.
+
+    Skill sets are stored as sorted skill-id lists, so their size follows
+    the number of skills a user has rather than the largest skill id; the
+    overlap for a post is a set intersection against the viewer's ids. Both
+    the candidate set and the per-user vectors are precomputed and cached in
+    Redis, ranking a page does not touch the database once they are warm.
+    """
+
+    CANDIDATES_KEY = "feed:ranked:v3:candidates"
+    CANDIDATES_TTL = 60          # seconds
+    CANDIDATES_WINDOW = 500      # most recent active posts considered
+
+    USER_VECTOR_KEY = "feed:ranked:v3:user:{user_id}"
+    USER_VECTOR_TTL = 300
+
+    SKILL_WEIGHT = 1.0
+    CATEGORY_WEIGHT = 0.5
+    RECENCY_HALF_LIFE_HOURS = 48
+
+    # Worker-local copy of the Redis candidate set: (expires_at, candidate set)
+    _local_candidates: tuple[float, Optional[dict]] = (0.0, None)
+
+    # ---------------- CANDIDATES ----------------
+    @staticmethod
+    def _skill_ids(db: Session, user_ids: set[int]) -> dict[int, list[int]]:
+        skills: dict[int, list[int]] = {}
+        if not user_ids:
+            return skills
+
+        rows = (
+            db.query(user_skills.c.user_id, user_skills.c.skill_id)
+            .filter(user_skills.c.user_id.in_(user_ids))
+            .order_by(user_skills.c.user_id, user_skills.c.skill_id)
+            .all()
+        )
+        for user_id, skill_id in rows:
+            skills.setdefault(user_id, []).append(skill_id)
+
+        return skills
+
+    @staticmethod
+    def _build_candidates(db: Session, head: str) -> dict:
+        rows = (
+            FeedService._feed_query(db)
+            .order_by(Post.created_at.desc(), Post.id.desc())
+            .limit(FeedRankingService.CANDIDATES_WINDOW)
+            .all()
+        )
+
+        skills = FeedRankingService._skill_ids(
+            db, {row.creator_id for row in rows if row.creator_id}
+        )
+
+        candidates = []
+        for row in rows:
+            post = FeedService._row_to_dict(row)
+            post["created_at"] = row.created_at.isoformat()
+            candidates.append({
+                "post": post,
+                "ts": row.created_at.replace(tzinfo=timezone.utc).timestamp(),
+                "skills": skills.get(row.creator_id, []),
+                "category": (row.category or "").lower(),
+            })
+
+        # built_at identifies this exact set; the router puts it in the ETag
+        return {"head": head, "built_at": time.time(), "candidates": candidates}
+
+    @staticmethod
+    def get_candidates(db: Session, head: str) -> dict:
+        # head is the feed's newest active post; a set built before it
+        # appeared is stale even if its TTL has not run out.
+        now = time.time()
+        expires_at, local = FeedRankingService._local_candidates
+        if local is not None and expires_at > now and local["head"] == head:
+            return local
+
+        cached = redis_client.get(FeedRankingService.CANDIDATES_KEY)
+        current = json.loads(cached) if cached is not None else None
+
+        if current is not None and current["head"] == head:
+            ttl = redis_client.ttl(FeedRankingService.CANDIDATES_KEY)
+        else:
+            current = FeedRankingService._build_candidates(db, head)
+            ttl = FeedRankingService.CANDIDATES_TTL
+            redis_client.setex(
+                FeedRankingService.CANDIDATES_KEY,
+                ttl,
+                json.dumps(current)
+            )
+
+        FeedRankingService._local_candidates = (now + max(ttl, 1), current)
+        return current
+
+    # ---------------- USER VECTOR ----------------
+    @staticmethod
+    def _build_user_vector(db: Session, user_id: int) -> dict:
+        skills = FeedRankingService._skill_ids(db, {user_id}).get(user_id, [])
+
+        # Category affinity: categories the user posts in or applies to
+        categories = Counter(
+            (category or "").lower()
+            for (category,) in (
+                db.query(Post.category)
+                .filter(Post.created_by == user_id)
+                .union_all(
+                    db.query(Post.category)
+                    .join(PostResponse, PostResponse.post_id == Post.id)
+                    .filter(PostResponse.responder_id == user_id)
+                )
+                .all()
+            )
+        )
+        top = max(categories.values(), default=0)
+
+        return {
+            "built_at": time.time(),
+            "skills": skills,
+            "categories": {
+                name: count / top for name, count in categories.items()
+            },
+        }
+
+    @staticmethod
+    def get_user_vector(db: Session, user_id: int) -> dict:
+        key = FeedRankingService.USER_VECTOR_KEY.format(user_id=user_id)
+
+        cached = redis_client.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        vector = FeedRankingService._build_user_vector(db, user_id)
+        redis_client.setex(
+            key,
+            FeedRankingService.USER_VECTOR_TTL,
+            json.dumps(vector)
+        )
+        return vector
+
+    @staticmethod
+    def invalidate_user(user_id: int):
+        redis_client.delete(
+            FeedRankingService.USER_VECTOR_KEY.format(user_id=user_id)
+        )
+
+    # ---------------- RANKING ----------------
+    @staticmethod
+    def _score(candidate: dict, vector: dict, viewer_skills: set[int], now: float) -> float:
+        skill_score = 0.0
+        if viewer_skills:
+            overlap = len(viewer_skills.intersection(candidate["skills"]))
+            skill_score = overlap / len(viewer_skills)
+
+        category_score = vector["categories"].get(candidate["category"], 0.0)
+
+        age_hours = max(0.0, now - candidate["ts"]) / 3600
+        recency = 0.5 ** (age_hours / FeedRankingService.RECENCY_HALF_LIFE_HOURS)
+
+        return (
+            1.0
+            + FeedRankingService.SKILL_WEIGHT * skill_score
+            + FeedRankingService.CATEGORY_WEIGHT * category_score
+        ) * recency
+
+    @staticmethod
+    def get_ranked_feed(
+        cursor: Optional[str],
+        limit: int,
+        candidates: dict,
+        vector: dict,
+        current_user: dict,
+    ):
+        # candidates / vector come from get_candidates / get_user_vector,
+        # fetched by the caller so its ETag describes exactly these inputs
+        try:
+            offset = int(cursor) if cursor else 0
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        user_id = current_user["user_id"]
+
+        viewer_skills = set(vector["skills"])
+        now = time.time()
+        ranked = heapq.nlargest(
+            offset + limit + 1,
+            (
+                c for c in candidates["candidates"]
+                if c["post"]["creator"]["id"] != user_id
+            ),
+            key=lambda c: FeedRankingService._score(c, vector, viewer_skills, now)
+        )
+
+        page = ranked[offset:offset + limit]
+        has_next = len(ranked) > offset + limit
+
+        return {
+            "posts": [c["post"] for c in page],
+            "pagination": {
+                "limit": limit,
+                "has_next": has_next,
+                "next_cursor": str(offset + limit) if has_next else None,
+            },
+        }
@@ -1,71 +1,144 @@
 from datetime import datetime
 from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import select, func, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import Session
 
-from app.models import Post
-from app.schemas.post_schema import FeedResponse, FeedPostResponse, FeedCreator, FeedPagination
+from app.models import Post, Users
+from app.models.post_image import PostImage
 
 
 class FeedService:
 
     @staticmethod
-    def get_feed(
-        cursor: Optional[datetime],
-        limit: int,
-        db: Session,
-        current_user: dict,
-    ):
-        from sqlalchemy.orm import joinedload
+    def _images_column():
+        # Correlated per-row aggregate: only evaluated for the rows that
+        # survive LIMIT, and returns NULL for posts without images.
+        return (
+            select(
+                func.array_agg(
+                    aggregate_order_by(PostImage.image_url, PostImage.id)
+                )
+            )
+            .where(PostImage.post_id == Post.id)
+            .correlate(Post)
+            .scalar_subquery()
+            .label("images")
+        )
+
+    @staticmethod
+    def _feed_query(db: Session):
+        return (
+            db.query(
+                Post.id,
+                Post.title,
+                Post.description,
+                Post.category,
+                Post.duration,
+                Post.created_at,
+                FeedService._images_column(),
+                Users.id.label("creator_id"),
+                Users.username.label("creator_username"),
+                Users.profile_image.label("creator_profile_image"),
+            )
+            .select_from(Post)
+            .outerjoin(Users, Users.id == Post.created_by)
+            .filter(Post.is_active == True)
+        )
 
-        query = (
-            db.query(Post)
-            .options(
-                joinedload(Post.creator),  # FIX creator N+1
-                # joinedload(Post.images)  # already joined, safe
+    @staticmethod
+    def _row_to_dict(row) -> dict:
+        return {
+            "id": row.id,
+            "title": row.title,
+            "description": row.description,
+            "category": row.category,
+            "duration": row.duration,
+            "images": row.images or [],
+            "creator": {
+                "id": row.creator_id,
+                "username": row.creator_username,
+                "profile_photo": row.creator_profile_image,
+            },
+            "created_at": row.created_at,
+        }
+
+    @staticmethod
+    def _encode_cursor(created_at: datetime, post_id: int) -> str:
+        return f"{created_at.isoformat()}|{post_id}"
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, Optional[int]]:
+        # "<created_at>|<id>"; a bare timestamp is still accepted from
+        # clients holding a cursor issued before ids were added.
+        created_at, _, post_id = cursor.partition("|")
+        try:
+            return (
+                datetime.fromisoformat(created_at),
+                int(post_id) if post_id else None,
             )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    @staticmethod
+    def _apply_cursor(query, cursor: Optional[str]):
+        if not cursor:
+            return query
+
+        created_at, post_id = FeedService._decode_cursor(cursor)
+
+        if post_id is None:
+            return query.filter(Post.created_at < created_at)
+
+        # Row comparison matches idx_posts_active_feed (created_at, id) so
+        # posts sharing a timestamp are neither skipped nor repeated.
+        return query.filter(
+            tuple_(Post.created_at, Post.id) < tuple_(created_at, post_id)
+        )
+
+    @staticmethod
+    def get_head(db: Session):
+        # Newest active (created_at, id): an index-only probe on
+        # idx_posts_active_feed, used as the feed's version for ETags.
+        return (
+            db.query(Post.created_at, Post.id)
             .filter(Post.is_active == True)
+            .order_by(Post.created_at.desc(), Post.id.desc())
+            .first()
         )
 
-        if cursor:
-            query = query.filter(Post.created_at < cursor)
+    @staticmethod
+    def get_feed(
+        cursor: Optional[str],
+        limit: int,
+        db: Session,
+        current_user: dict,
+    ):
+        # Rows are plain tuples: no identity map, no PostImage/Users
+        # entities, response dicts are built straight from the columns.
+        query = FeedService._apply_cursor(FeedService._feed_query(db), cursor)
 
-        posts = (
+        rows = (
             query
-            .order_by(Post.created_at.desc())
+            .order_by(Post.created_at.desc(), Post.id.desc())
             .limit(limit + 1)
             .all()
         )
 
-        has_next = len(posts) > limit
-        posts = posts[:limit]
-
-        next_cursor = posts[-1].created_at if posts else None
-
-        response = []
-
-        for post in posts:
-            response.append(
-                FeedPostResponse(
-                    id=post.id,
-                    title=post.title,
-                    description=post.description,
-                    category=post.category,
-                    duration=post.duration,
-                    images=[image.image_url for image in post.images],
-                    creator=FeedCreator(
-                        id=post.creator.id if post.creator else None,
-                        username=post.creator.username if post.creator else None,
-                        profile_photo=post.creator.profile_image if post.creator else None
-                    ),
-                    created_at=post.created_at
-                )
-            )
+        has_next = len(rows) > limit
+        rows = rows[:limit]
 
-        return FeedResponse(
-            posts=response,
-            pagination=FeedPagination(
-                limit=limit,
-                has_next=has_next,
-                next_cursor=next_cursor.isoformat() if next_cursor else None
-            )
+        next_cursor = (
+            FeedService._encode_cursor(rows[-1].created_at, rows[-1].id)
+            if rows else None
         )
+
+        return {
+            "posts": [FeedService._row_to_dict(row) for row in rows],
+            "pagination": {
+                "limit": limit,
+                "has_next": has_next,
+                "next_cursor": next_cursor,
+            },
+        }
@@ -37,7 +37,7 @@ class PasswordService:
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        user.hashed_password = Hash.hash(new_password)
+        user.hashed_password = await Hash.hash_async(new_password)
         db.commit()
 
         return {"message": "Password updated"}
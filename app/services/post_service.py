@@ -2,15 +2,19 @@ from datetime import datetime
 
 from fastapi import HTTPException
 from sqlalchemy import desc
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from app.models import Users
+from app.models.loaders import POST_WITH_CREATOR_AND_IMAGES, POST_WITH_IMAGES
 from app.models.notification import NotificationType
 from app.models.post_image import PostImage
 from app.models.posts import Post
 from app.models.post_response import PostResponse
 from app.schemas.post_response import MyPostResponse
+from app.services.cache_version_service import CacheVersionService
+from app.services.category_service import CategoryService
 from app.services.moderation_service import ModerationService
+from app.services.skill_stats_service import SkillStatsService
 from app.services.notification_service import NotificationService
 
 
@@ -50,6 +54,9 @@ class PostService:
         db.add(post)
         db.flush()  # get post.id
 
+        CategoryService.record_usage(db, category)
+        SkillStatsService.on_post_created(db, created_by)
+
         if photo_url:
             db.add_all([
                 PostImage(image_url=url, post_id=post.id)
@@ -58,13 +65,13 @@ class PostService:
 
         db.commit()
 
-        # Reload with relationships in ONE query
+        # New post changes skill page post lists and counts
+        CacheVersionService.bump_skills_version()
+
+        # Reload with creator (joined) and images (selectin)
         post = (
             db.query(Post)
-            .options(
-                joinedload(Post.creator),
-                joinedload(Post.images)
-            )
+            .options(*POST_WITH_CREATOR_AND_IMAGES)
             .filter(Post.id == post.id)
             .first()
         )
@@ -245,6 +252,7 @@ class PostService:
     ):
         posts = (
             db.query(Post)
+            .options(*POST_WITH_IMAGES)
             .filter(Post.created_by == user_id)
             .order_by(desc(Post.created_at))
             .offset(offset)
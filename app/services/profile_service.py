@@ -2,20 +2,34 @@ import json
 from typing import Optional
 from fastapi import HTTPException, UploadFile
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 from cloudinary.uploader import upload
 import re
 import logging
 from app.models.users import Users
 from app.models.skills import Skills
+from app.models.user_skills import user_skills
+from app.redis_client import redis_client
+from app.core.skill_index import skill_index
+from app.services.cache_version_service import CacheVersionService
+from app.services.feed_ranking_service import FeedRankingService
 from app.services.moderation_service import ModerationService
+from app.services.skill_resolver_service import SkillResolverService
+from app.services.skill_stats_service import SkillStatsService
 
 
 class ProfileService:
 
+    # Keyed by the user's cache version, so every profile write (which
+    # bumps it) orphans the old snapshot and it simply expires.
+    SNAPSHOT_KEY = "profile:snapshot:{user_id}:{version}"
+    SNAPSHOT_TTL = 86400
+
     @staticmethod
     def _process_skills(skills: list[str], db: Session):
+        # Returns (skill ids, names of skills created here)
         cleaned = set()
-        skill_objects = []
+        created = []
 
         for raw in skills:
             for part in raw.split(","):
@@ -31,16 +45,66 @@ class ProfileService:
 
         logging.debug(f"CLEANED SKILLS: {cleaned}")
 
-        for name in cleaned:
-            skill = db.query(Skills).filter(Skills.name == name).first()
-            if not skill:
-                skill = Skills(name=name)
-                db.add(skill)
-                db.flush()
+        if not cleaned:
+            return set(), []
+
+        ids = dict(
+            db.query(Skills.name, Skills.id).filter(Skills.name.in_(cleaned)).all()
+        )
+
+        missing = sorted(cleaned - ids.keys())
+        if missing:
+            # ON CONFLICT: a concurrent request may insert the same new skill
+            stmt = (
+                insert(Skills)
+                .values([{"name": name} for name in missing])
+                .on_conflict_do_nothing(index_elements=[Skills.name])
+                .returning(Skills.name, Skills.id)
+            )
+            inserted = dict(db.execute(stmt).all())
+            created = sorted(inserted)
+            ids.update(inserted)
+
+            # Rows the other request won are not returned; read them back
+            lost = [name for name in missing if name not in inserted]
+            if lost:
+                ids.update(
+                    db.query(Skills.name, Skills.id).filter(Skills.name.in_(lost)).all()
+                )
+
+        return set(ids.values()), created
+
+    @staticmethod
+    def _set_skills(user: Users, skill_ids: set[int], db: Session):
+        old_ids = {
+            skill_id for (skill_id,) in
+            db.query(user_skills.c.skill_id).filter(user_skills.c.user_id == user.id)
+        }
+        added = skill_ids - old_ids
+        removed = old_ids - skill_ids
+
+        if removed:
+            db.execute(
+                user_skills.delete().where(
+                    user_skills.c.user_id == user.id,
+                    user_skills.c.skill_id.in_(removed)
+                )
+            )
+        if added:
+            # A concurrent update of the same profile may add the same pair
+            db.execute(
+                insert(user_skills).on_conflict_do_nothing(
+                    index_elements=[user_skills.c.user_id, user_skills.c.skill_id]
+                ),
+                [{"user_id": user.id, "skill_id": skill_id} for skill_id in added]
+            )
 
-            skill_objects.append(skill)
+        # Association rows changed underneath the relationship
+        db.expire(user, ["skills"])
 
-        return skill_objects
+        SkillStatsService.on_user_skills_changed(
+            db, user, added=added, removed=removed
+        )
 
     @staticmethod
     async def complete_profile(
@@ -76,7 +140,8 @@ class ProfileService:
             raise HTTPException(status_code=404, detail="User not found")
 
         user.bio = bio
-        user.skills = ProfileService._process_skills(skills, db)
+        skill_ids, created_skills = ProfileService._process_skills(skills, db)
+        ProfileService._set_skills(user, skill_ids, db)
 
         if profilePhoto:
             user.profile_image = upload(profilePhoto.file)["secure_url"]
@@ -84,30 +149,58 @@ class ProfileService:
         db.commit()
         db.refresh(user)
 
+        CacheVersionService.bump_user_version(user.id)
+        CacheVersionService.bump_skills_version()
+        FeedRankingService.invalidate_user(user.id)
+        skill_index.publish(created_skills)
+        SkillResolverService.forget(created_skills)
+
         return {"message": "Profile completed successfully"}
 
 
-    # Fetch Profile
+    # Profile snapshot shared by /auth/me and /profile/me
     @staticmethod
-    def get_my_profile(db: Session, current_user: dict):
-        user = (
-            db.query(Users)
-            .filter(Users.id == current_user["user_id"])
-            .first()
-        )
+    def get_snapshot(db: Session, user_id: int, version: Optional[int] = None) -> dict:
+        if version is None:
+            version = CacheVersionService.get_user_version(user_id)
+
+        key = ProfileService.SNAPSHOT_KEY.format(user_id=user_id, version=version)
+        cached = redis_client.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        user = db.query(Users).filter(Users.id == user_id).first()
 
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        return {
+        snapshot = {
             "id": user.id,
             "first_name": user.first_name,
             "last_name": user.last_name,
-            "display_name": f"{user.first_name} {user.last_name}",
             "email": user.email,
             "bio": user.bio,
             "profile_image": user.profile_image,
-            "skills": [skill.name for skill in user.skills]
+            "skills": [skill.name for skill in user.skills],
+            "is_verified": user.is_verified,
+        }
+        redis_client.setex(key, ProfileService.SNAPSHOT_TTL, json.dumps(snapshot))
+        return snapshot
+
+    # Fetch Profile
+    @staticmethod
+    def get_my_profile(db: Session, current_user: dict):
+        snapshot = ProfileService.get_snapshot(db, current_user["user_id"])
+
+        return {
+            "id": snapshot["id"],
+            "first_name": snapshot["first_name"],
+            "last_name": snapshot["last_name"],
+            "display_name": f"{snapshot['first_name']} {snapshot['last_name']}",
+            "email": snapshot["email"],
+            "bio": snapshot["bio"],
+            "profile_image": snapshot["profile_image"],
+            "skills": snapshot["skills"]
         }
 
     @staticmethod
@@ -138,10 +231,8 @@ class ProfileService:
         if skills is not None:
             logging.debug(f"RAW SKILLS: {skills}")
 
-            user.skills.clear()
-            db.flush()
-
-            user.skills = ProfileService._process_skills(skills, db)
+            skill_ids, created_skills = ProfileService._process_skills(skills, db)
+            ProfileService._set_skills(user, skill_ids, db)
 
         # IMAGE UPDATE
         if profile_image:
@@ -150,6 +241,14 @@ class ProfileService:
         db.commit()
         db.refresh(user)
 
+        CacheVersionService.bump_user_version(user.id)
+        CacheVersionService.bump_skills_version()
+
+        if skills is not None:
+            FeedRankingService.invalidate_user(user.id)
+            skill_index.publish(created_skills)
+            SkillResolverService.forget(created_skills)
+
         return {"message": "Profile updated successfully"}
 
 
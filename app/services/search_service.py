@@ -1,47 +1,49 @@
+import re
+from typing import Optional
+
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import asc, or_
-from app.models.skills import Skills
+from sqlalchemy import Float, and_, asc, case, cast, func, or_
+from app.core.skill_index import skill_index
+from app.database import gather_in_sessions
+from app.models.loaders import POST_LIST_COLUMNS, POST_CREATOR_COLUMNS
+from app.models.category import Category
 from app.models.posts import Post
+from app.models.users import Users
 
 
 class SearchService:
     @staticmethod
-    def search_skills(
-            db: Session,
-            query: str,
-            limit: int = 8
-    ):
-        # Get prefix matches
-        prefix = (
-            db.query(Skills)
-            .filter(Skills.name.ilike(f"{query}%"))
-            .order_by(asc(Skills.name))
-            .limit(limit)
-            .all()
+    def _escape_like(query: str) -> str:
+        return (
+            query.replace("\\", "\\\\")
+            .replace("%", "\\%")
+            .replace("_", "\\_")
         )
 
-        # If we have enough prefix matches, return early
-        if len(prefix) >= limit:
-            return prefix
+    @staticmethod
+    def _ranked_match(column, query: str, popularity=None):
+        """
+        Single-query substring match ranked by relevance.
 
-        # Get IDs of prefix matches to exclude from fuzzy search
-        prefix_ids = {skill.id for skill in prefix}
+        The ILIKE '%q%' filter is served by the pg_trgm GIN index and ties
+        between prefix / non-prefix matches are broken by trigram
+        similarity, then by popularity if given.
+        """
+        pattern = SearchService._escape_like(query)
 
-        # Get fuzzy matches (excluding prefix matches)
-        remaining_needed = limit - len(prefix)
-        fuzzy = (
-            db.query(Skills)
-            .filter(
-                Skills.name.ilike(f"%{query}%"),
-                ~Skills.name.ilike(f"{query}%"),  # Exclude prefix matches
-                ~Skills.id.in_(prefix_ids)  # Also exclude by ID for safety
-            )
-            .order_by(asc(Skills.name))
-            .limit(remaining_needed)
-            .all()
+        condition = column.ilike(f"%{pattern}%", escape="\\")
+        prefix_first = case(
+            (column.ilike(f"{pattern}%", escape="\\"), 0),
+            else_=1
         )
 
-        return prefix + fuzzy
+        ordering = [prefix_first, func.similarity(column, query).desc()]
+        if popularity is not None:
+            ordering.append(popularity.desc())
+        ordering.append(asc(column))
+
+        return condition, ordering
 
     @staticmethod
     def search_category(
@@ -49,50 +51,236 @@ class SearchService:
             query: str,
             limit: int = 8
     ):
+        # Queries the categories dictionary, not posts: cost scales with
+        # the number of distinct categories.
+        condition, ordering = SearchService._ranked_match(
+            Category.name, query, popularity=Category.usage_count
+        )
 
-        # Get prefix matches
-        prefix = (
-            db.query(Post)
-            .filter(Post.category.ilike(f"{query}%"))
-            .order_by(asc(Post.category))
+        return (
+            db.query(Category)
+            .filter(condition)
+            .order_by(*ordering)
             .limit(limit)
             .all()
         )
 
-        # If we have enough prefix matches, return early
-        if len(prefix) >= limit:
-            return prefix
+    @staticmethod
+    def search_users(
+            db: Session,
+            query: str,
+            limit: int = 8
+    ):
+        pattern = SearchService._escape_like(query)
+        fields = (Users.username, Users.first_name, Users.last_name)
 
-        # Get IDs of prefix matches to exclude from fuzzy search
-        prefix_ids = {post.id for post in prefix}
+        any_prefix = or_(*(f.ilike(f"{pattern}%", escape="\\") for f in fields))
 
-        # Get fuzzy matches (excluding prefix matches)
-        remaining_needed = limit - len(prefix)
-        fuzzy = (
-            db.query(Post)
+        return (
+            db.query(
+                Users.id,
+                Users.username,
+                Users.first_name,
+                Users.last_name,
+                Users.profile_image,
+            )
             .filter(
-                Post.category.ilike(f"%{query}%"),
-                ~Post.category.ilike(f"{query}%"),  # Exclude prefix matches
-                ~Post.id.in_(prefix_ids)  # Also exclude by ID for safety
+                Users.is_active == True,
+                or_(*(f.ilike(f"%{pattern}%", escape="\\") for f in fields))
             )
-            .order_by(asc(Post.category))
-            .limit(remaining_needed)
+            .order_by(case((any_prefix, 0), else_=1), asc(Users.username))
+            .limit(limit)
             .all()
         )
 
-        return prefix + fuzzy
+    # ---------------- POST FULL-TEXT ----------------
+    @staticmethod
+    def _prefix_tsquery(query: str):
+        # Type-ahead: every word must match, the last one as a prefix
+        # ("react nat" -> 'react' & 'nat':*)
+        words = re.findall(r"\w+", query.lower())
+        if not words:
+            return None
+        words[-1] += ":*"
+        return func.to_tsquery("english", " & ".join(words))
 
     @staticmethod
-    def search_all(
+    def _decode_rank_cursor(cursor: str) -> tuple[float, int]:
+        rank, _, post_id = cursor.partition("|")
+        try:
+            return float(rank), int(post_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    @staticmethod
+    def search_posts(
             db: Session,
             query: str,
-            limit: int = 8
+            category: Optional[str] = None,
+            is_active: bool = True,
+            cursor: Optional[str] = None,
+            limit: int = 20,
+            tsquery=None
     ):
+        """
+        Full-text post search over the generated posts.search_vector (GIN
+        index), ordered by ts_rank with a (rank, id) keyset cursor.
+        """
+        if tsquery is None:
+            tsquery = func.websearch_to_tsquery("english", query)
+
+        # ts_rank is real; as double precision the value psycopg2 returns
+        # (and the cursor carries) compares equal to the one recomputed here
+        rank = cast(func.ts_rank(Post.search_vector, tsquery), Float).label("rank")
+
+        q = (
+            db.query(*POST_LIST_COLUMNS, *POST_CREATOR_COLUMNS, rank)
+            .select_from(Post)
+            .outerjoin(Users, Users.id == Post.created_by)
+            .filter(
+                Post.search_vector.op("@@")(tsquery),
+                Post.is_active == is_active
+            )
+        )
+
+        if category:
+            q = q.filter(Post.category == category)
+
+        if cursor:
+            last_rank, last_id = SearchService._decode_rank_cursor(cursor)
+            q = q.filter(or_(
+                rank < last_rank,
+                and_(rank == last_rank, Post.id < last_id)
+            ))
+
+        rows = (
+            q.order_by(rank.desc(), Post.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+
+        return {
+            "posts": [
+                {
+                    "id": row.id,
+                    "title": row.title,
+                    "description": row.description,
+                    "category": row.category,
+                    "duration": row.duration,
+                    "created_at": row.created_at,
+                    "rank": row.rank,
+                    "creator": {
+                        "id": row.creator_id,
+                        "username": row.creator_username,
+                        "profile_image": row.creator_profile_image,
+                    },
+                }
+                for row in rows
+            ],
+            "pagination": {
+                "limit": limit,
+                "has_next": has_next,
+                "next_cursor": (
+                    f"{rows[-1].rank}|{rows[-1].id}" if has_next else None
+                ),
+            },
+        }
+
+    # ---------------- UNIFIED SEARCH ----------------
+    @staticmethod
+    def _text_score(label: str | None, query: str) -> float:
+        label = (label or "").lower()
+        if label == query:
+            return 1.0
+        if label.startswith(query):
+            return 0.8
+        if any(word.startswith(query) for word in label.split()):
+            return 0.6
+        if query in label:
+            return 0.4
+        # Matched on another field (e.g. a user's last name)
+        return 0.2
+
+    @staticmethod
+    def _skill_section(db: Session, query: str, limit: int) -> list[dict]:
+        skill_index.refresh_in_background()
+        return [
+            {"type": "skill", "id": name, "label": name}
+            for name in skill_index.search(query, limit)
+        ]
+
+    @staticmethod
+    def _category_section(db: Session, query: str, limit: int) -> list[dict]:
+        return [
+            {"type": "category", "id": c.id, "label": c.name}
+            for c in SearchService.search_category(db, query, limit)
+        ]
+
+    @staticmethod
+    def _user_section(db: Session, query: str, limit: int) -> list[dict]:
+        items = []
+        for u in SearchService.search_users(db, query, limit):
+            full_name = " ".join(filter(None, (u.first_name, u.last_name)))
+            items.append({
+                "type": "user",
+                "id": u.id,
+                "label": u.username or full_name,
+                "full_name": full_name,
+                "profile_image": u.profile_image,
+                "_match": max(
+                    (u.username, u.first_name, full_name),
+                    key=lambda text: SearchService._text_score(text, query)
+                ),
+            })
+        return items
+
+    @staticmethod
+    def _post_section(db: Session, query: str, limit: int) -> list[dict]:
+        tsquery = SearchService._prefix_tsquery(query)
+        if tsquery is None:
+            return []
+
+        return [
+            {"type": "post", "id": p["id"], "label": p["title"], "category": p["category"]}
+            for p in SearchService.search_posts(
+                db, query, limit=limit, tsquery=tsquery
+            )["posts"]
+        ]
+
+    @staticmethod
+    async def search_all(query: str, limit: int = 5):
+        q = query.strip().lower()
+
+        sections = {
+            "skill": SearchService._skill_section,
+            "category": SearchService._category_section,
+            "user": SearchService._user_section,
+            "post": SearchService._post_section,
+        }
+
+        # Sections run concurrently in the threadpool, each on its own
+        # connection: latency is the slowest sub-search, not their sum.
+        results = await gather_in_sessions(*(
+            (section, q, limit) for section in sections.values()
+        ))
+
+        merged = []
+        for items in results:
+            for item in items:
+                match = item.pop("_match", item["label"])
+                item["score"] = SearchService._text_score(match, q)
+                merged.append(item)
 
-        skills = SearchService.search_skills(db, query, limit)
-        categories = SearchService.search_category(db, query, limit)
+        # Stable sort keeps section order (skills first) on equal scores
+        merged.sort(key=lambda item: item["score"], reverse=True)
 
         return {
-            "skills": skills,
-            "categories": categories
-        }
\ No newline at end of file
+            "results": merged,
+            "counts": {
+                name: len(items)
+                for name, items in zip(sections, results)
+            },
+        }
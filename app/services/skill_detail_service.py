@@ -1,112 +1,223 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, func
-from app.models.skills import Skills
+import json
+
+from sqlalchemy.orm import Session
+from sqlalchemy import asc, case, desc, func
+from app.database import gather_in_sessions
+from app.models.loaders import POST_LIST_COLUMNS, POST_CREATOR_COLUMNS
 from app.models.posts import Post
+from app.models.skill_stats import SkillStats
+from app.models.skills import Skills
+from app.models.user_skills import user_skills
 from app.models.users import Users
-from typing import Dict, List, Any
+from app.redis_client import redis_client
+from app.services.cache_version_service import CacheVersionService
+from app.services.skill_resolver_service import SkillResolverService
+from app.services.search_service import SearchService
+from app.services.skill_stats_service import SkillStatsService
+from typing import Dict, List, Any, Optional
 
 
 class SkillDetailService:
 
+    # Versioned like the skill page ETag, so a cached page never outlives
+    # the write that bumped the skills version
+    DETAILS_CACHE_KEY = "skill:details:{skill_id}:{version}"
+    DETAILS_CACHE_TTL = 30  # seconds
+
+    SEARCH_CACHE_KEY = "skill:search_details:{limit}:{query}"
+    SEARCH_CACHE_TTL = 60
+
     @staticmethod
-    def get_skill_details(db: Session, skill_name: str) -> Dict[str, Any]:
-        # Case-insensitive partial match
-        skill = (
-            db.query(Skills)
-            .filter(Skills.name.ilike(f"%{skill_name}%"))
-            .first()
+    def _skill_posts_query(db: Session, skill_id: int):
+        # Column projection: no Post/Users entities, no image or skills loads
+        return (
+            db.query(*POST_LIST_COLUMNS, *POST_CREATOR_COLUMNS)
+            .select_from(Post)
+            .join(Users, Post.created_by == Users.id)
+            .join(user_skills, user_skills.c.user_id == Users.id)
+            .filter(user_skills.c.skill_id == skill_id, Post.is_active == True)
+            .order_by(desc(Post.created_at))
         )
 
-        if not skill:
-            return {
-                "found": False,
-                "message": f"Skill '{skill_name}' not found"
+    @staticmethod
+    def _post_row_to_dict(row) -> Dict[str, Any]:
+        return {
+            "id": row.id,
+            "title": row.title,
+            "description": row.description,
+            "category": row.category,
+            "duration": row.duration,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "creator": {
+                "id": row.creator_id,
+                "username": row.creator_username,
+                "first_name": row.creator_first_name,
+                "last_name": row.creator_last_name,
+                "profile_image": row.creator_profile_image,
             }
+        }
+
+    @staticmethod
+    def _skill_accounts_query(db: Session, skill_id: int):
+        # Only the returned columns (no Users.skills selectin)
+        return (
+            db.query(
+                Users.id,
+                Users.username,
+                Users.first_name,
+                Users.last_name,
+                Users.bio,
+                Users.profile_image,
+                Users.is_verified,
+            )
+            .join(user_skills, user_skills.c.user_id == Users.id)
+            .filter(user_skills.c.skill_id == skill_id, Users.is_active == True)
+            .order_by(Users.id)
+        )
 
-        # Get users with JOIN (optimized)
-        users_with_skill = (
-            db.query(Users)
-            .join(Users.skills)
-            .filter(Skills.id == skill.id, Users.is_active == True)
+    @staticmethod
+    def _skill_accounts(db: Session, skill_id: int, skip: int, limit: int) -> List[Dict[str, Any]]:
+        rows = (
+            SkillDetailService._skill_accounts_query(db, skill_id)
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
-        # Limit initial response (important)
-        users_with_skill = users_with_skill[:20]
+        return [
+            {
+                "id": row.id,
+                "username": row.username,
+                "first_name": row.first_name,
+                "last_name": row.last_name,
+                "bio": row.bio,
+                "profile_image": row.profile_image,
+                "is_verified": row.is_verified,
+            }
+            for row in rows
+        ]
 
-        # Get posts with JOIN + eager loading
-        posts = (
-            db.query(Post)
-            .options(joinedload(Post.creator))
-            .join(Users, Post.created_by == Users.id)
-            .join(Users.skills)
-            .filter(
-                Skills.id == skill.id,
-                Post.is_active == True
-            )
-            .order_by(desc(Post.created_at))
-            .limit(20)
+    @staticmethod
+    def _skill_posts(db: Session, skill_id: int, skip: int, limit: int) -> List[Dict[str, Any]]:
+        rows = (
+            SkillDetailService._skill_posts_query(db, skill_id)
+            .offset(skip)
+            .limit(limit)
             .all()
         )
+        return [SkillDetailService._post_row_to_dict(row) for row in rows]
+
+    @staticmethod
+    async def get_skill_details(
+        db: Session,
+        skill_name: str,
+        version: Optional[int] = None
+    ) -> Dict[str, Any]:
+        skill = SkillResolverService.resolve(db, skill_name)
+
+        if not skill:
+            return {
+                "found": False,
+                "message": f"Skill '{skill_name}' not found"
+            }
 
-        # Counts (optimized)
-        total_accounts = (
-            db.query(func.count(Users.id))
-            .join(Users.skills)
-            .filter(Skills.id == skill.id, Users.is_active == True)
-            .scalar()
+        if version is None:
+            version = CacheVersionService.get_skills_version()
+
+        cache_key = SkillDetailService.DETAILS_CACHE_KEY.format(
+            skill_id=skill["id"], version=version
         )
+        cached = redis_client.get(cache_key)
+        if cached is not None:
+            return json.loads(cached)
 
-        total_posts = (
-            db.query(func.count(Post.id))
-            .join(Users, Post.created_by == Users.id)
-            .join(Users.skills)
-            .filter(Skills.id == skill.id, Post.is_active == True)
-            .scalar()
+        # Give the request's connection back before borrowing others
+        db.close()
+
+        # Independent sub-queries run concurrently, each on its own connection
+        accounts, posts, stats = await gather_in_sessions(
+            (SkillDetailService._skill_accounts, skill["id"], 0, 20),
+            (SkillDetailService._skill_posts, skill["id"], 0, 20),
+            (SkillStatsService.get, skill["id"]),
         )
 
-        return {
+        result = {
             "found": True,
             "skill": {
-                "id": skill.id,
-                "name": skill.name,
+                "id": skill["id"],
+                "name": skill["name"],
             },
-            "accounts": [
-                {
-                    "id": user.id,
-                    "username": user.username,
-                    "first_name": user.first_name,
-                    "last_name": user.last_name,
-                    "bio": user.bio,
-                    "profile_image": user.profile_image,
-                    "is_verified": user.is_verified,
-                }
-                for user in users_with_skill
-            ],
-            "posts": [
-                {
-                    "id": post.id,
-                    "title": post.title,
-                    "description": post.description,
-                    "category": post.category,
-                    "duration": post.duration,
-                    "created_at": post.created_at.isoformat() if post.created_at else None,
-                    "creator": {
-                        "id": post.creator.id,
-                        "username": post.creator.username,
-                        "first_name": post.creator.first_name,
-                        "last_name": post.creator.last_name,
-                        "profile_image": post.creator.profile_image,
-                    }
-                }
-                for post in posts
-            ],
-            "stats": {
-                "total_accounts": total_accounts,
-                "total_posts": total_posts,
-            }
+            "accounts": accounts,
+            "posts": posts,
+            "stats": stats
         }
 
+        redis_client.setex(
+            cache_key,
+            SkillDetailService.DETAILS_CACHE_TTL,
+            json.dumps(result)
+        )
+
+        return result
+
+    @staticmethod
+    def search_skills_with_count(db: Session, q: str, limit: int = 8) -> List[Dict[str, Any]]:
+        query = SkillResolverService.normalize(q)
+        if not query:
+            return []
+
+        cache_key = SkillDetailService.SEARCH_CACHE_KEY.format(limit=limit, query=query)
+        cached = redis_client.get(cache_key)
+        if cached is not None:
+            return json.loads(cached)
+
+        pattern = SearchService._escape_like(query)
+        total_accounts = func.coalesce(SkillStats.total_accounts, 0)
+        total_posts = func.coalesce(SkillStats.total_posts, 0)
+
+        # One round trip: matching skills with their materialized counts,
+        # exact > prefix > substring, then most used first.
+        rows = (
+            db.query(
+                Skills.id,
+                Skills.name,
+                total_accounts.label("total_accounts"),
+                total_posts.label("total_posts"),
+            )
+            .outerjoin(SkillStats, SkillStats.skill_id == Skills.id)
+            .filter(Skills.name.ilike(f"%{pattern}%", escape="\\"))
+            .order_by(
+                case(
+                    (func.lower(Skills.name) == query, 0),
+                    (Skills.name.ilike(f"{pattern}%", escape="\\"), 1),
+                    else_=2
+                ),
+                desc(total_accounts),
+                desc(total_posts),
+                asc(Skills.name)
+            )
+            .limit(limit)
+            .all()
+        )
+
+        results = [
+            {
+                "id": row.id,
+                "name": row.name,
+                "total_accounts": row.total_accounts,
+                "total_posts": row.total_posts,
+            }
+            for row in rows
+        ]
+
+        redis_client.setex(
+            cache_key,
+            SkillDetailService.SEARCH_CACHE_TTL,
+            json.dumps(results)
+        )
+
+        return results
+
     @staticmethod
     def get_skill_accounts(
         db: Session,
@@ -115,46 +226,19 @@ class SkillDetailService:
         limit: int = 20
     ) -> Dict[str, Any]:
 
-        skill = (
-            db.query(Skills)
-            .filter(Skills.name.ilike(f"%{skill_name}%"))
-            .first()
-        )
+        skill = SkillResolverService.resolve(db, skill_name)
 
         if not skill:
             return {"found": False, "accounts": [], "total": 0}
 
-        total = (
-            db.query(func.count(Users.id))
-            .join(Users.skills)
-            .filter(Skills.id == skill.id, Users.is_active == True)
-            .scalar()
-        )
+        total = SkillStatsService.get(db, skill["id"])["total_accounts"]
 
-        accounts = (
-            db.query(Users)
-            .join(Users.skills)
-            .filter(Skills.id == skill.id, Users.is_active == True)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        accounts = SkillDetailService._skill_accounts(db, skill["id"], skip, limit)
 
         return {
             "found": True,
-            "skill_name": skill.name,
-            "accounts": [
-                {
-                    "id": user.id,
-                    "username": user.username,
-                    "first_name": user.first_name,
-                    "last_name": user.last_name,
-                    "bio": user.bio,
-                    "profile_image": user.profile_image,
-                    "is_verified": user.is_verified,
-                }
-                for user in accounts
-            ],
+            "skill_name": skill["name"],
+            "accounts": accounts,
             "skip": skip,
             "limit": limit,
             "total": total
@@ -168,56 +252,19 @@ class SkillDetailService:
         limit: int = 20
     ) -> Dict[str, Any]:
 
-        skill = (
-            db.query(Skills)
-            .filter(Skills.name.ilike(f"%{skill_name}%"))
-            .first()
-        )
+        skill = SkillResolverService.resolve(db, skill_name)
 
         if not skill:
             return {"found": False, "posts": [], "total": 0}
 
-        total = (
-            db.query(func.count(Post.id))
-            .join(Users, Post.created_by == Users.id)
-            .join(Users.skills)
-            .filter(Skills.id == skill.id, Post.is_active == True)
-            .scalar()
-        )
+        total = SkillStatsService.get(db, skill["id"])["total_posts"]
 
-        posts = (
-            db.query(Post)
-            .options(joinedload(Post.creator))
-            .join(Users, Post.created_by == Users.id)
-            .join(Users.skills)
-            .filter(Skills.id == skill.id, Post.is_active == True)
-            .order_by(desc(Post.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        posts = SkillDetailService._skill_posts(db, skill["id"], skip, limit)
 
         return {
             "found": True,
-            "skill_name": skill.name,
-            "posts": [
-                {
-                    "id": post.id,
-                    "title": post.title,
-                    "description": post.description,
-                    "category": post.category,
-                    "duration": post.duration,
-                    "created_at": post.created_at.isoformat() if post.created_at else None,
-                    "creator": {
-                        "id": post.creator.id,
-                        "username": post.creator.username,
-                        "first_name": post.creator.first_name,
-                        "last_name": post.creator.last_name,
-                        "profile_image": post.creator.profile_image,
-                    }
-                }
-                for post in posts
-            ],
+            "skill_name": skill["name"],
+            "posts": posts,
             "skip": skip,
             "limit": limit,
             "total": total
@@ -0,0 +1,129 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.skills import Skills
+from app.redis_client import redis_client
+
+
+class SkillResolverService:
+    """
+    Resolves a skill name from a URL to a single skill, deterministically.
+
+    1. exact match on the normalized name (unique index on skills.name)
+    2. otherwise the most similar name by trigram similarity
+
+    Results are memoized in a small in-process LRU and in Redis, so the
+    details / accounts / posts endpoints of one skill page resolve with at
+    most one indexed lookup. Only exact matches are kept long: misses and
+    fuzzy matches can change whenever a skill is added, they use MISS_TTL
+    and are dropped on every worker when the skill index broadcasts one.
+    """
+
+    CACHE_KEY = "skill:resolve:{name}"
+    CACHE_TTL = 3600
+    MISS_TTL = 60
+
+    LOCAL_SIZE = 1024
+    LOCAL_TTL = 300
+
+    MIN_SIMILARITY = 0.3
+
+    # normalized name -> (expires_at, {"id", "name"} or None)
+    _local: "OrderedDict[str, tuple[float, Optional[dict]]]" = OrderedDict()
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        # Same shape ProfileService stores skills in
+        return " ".join(name.strip().lower().split())
+
+    @staticmethod
+    def _is_exact(name: str, skill: Optional[dict]) -> bool:
+        return skill is not None and skill["name"] == name
+
+    @staticmethod
+    def _ttl(name: str, skill: Optional[dict], exact_ttl: int) -> int:
+        if SkillResolverService._is_exact(name, skill):
+            return exact_ttl
+        return SkillResolverService.MISS_TTL
+
+    @staticmethod
+    def _remember(name: str, skill: Optional[dict]):
+        local = SkillResolverService._local
+        ttl = SkillResolverService._ttl(name, skill, SkillResolverService.LOCAL_TTL)
+        local[name] = (time.monotonic() + ttl, skill)
+        local.move_to_end(name)
+        while len(local) > SkillResolverService.LOCAL_SIZE:
+            local.popitem(last=False)
+
+    @staticmethod
+    def _lookup(db: Session, name: str) -> Optional[dict]:
+        skill = db.query(Skills.id, Skills.name).filter(Skills.name == name).first()
+
+        if not skill:
+            similarity = func.similarity(Skills.name, name)
+            skill = (
+                db.query(Skills.id, Skills.name)
+                .filter(
+                    Skills.name.op("%")(name),
+                    similarity >= SkillResolverService.MIN_SIMILARITY
+                )
+                .order_by(similarity.desc(), Skills.id)
+                .first()
+            )
+
+        return {"id": skill.id, "name": skill.name} if skill else None
+
+    @staticmethod
+    def resolve(db: Session, skill_name: str) -> Optional[dict]:
+        name = SkillResolverService.normalize(skill_name)
+        if not name:
+            return None
+
+        cached = SkillResolverService._local.get(name)
+        if cached and cached[0] > time.monotonic():
+            SkillResolverService._local.move_to_end(name)
+            return cached[1]
+
+        key = SkillResolverService.CACHE_KEY.format(name=name)
+        value = redis_client.get(key)
+        if value is not None:
+            skill = json.loads(value)
+        else:
+            skill = SkillResolverService._lookup(db, name)
+            redis_client.setex(
+                key,
+                SkillResolverService._ttl(name, skill, SkillResolverService.CACHE_TTL),
+                json.dumps(skill)
+            )
+
+        SkillResolverService._remember(name, skill)
+        return skill
+
+    @staticmethod
+    def forget_local(names: list[str]):
+        # New skills may change what any miss or fuzzy match resolves to;
+        # exact matches stay valid. Called on every worker via skill_index.
+        local = SkillResolverService._local
+        for raw in names:
+            local.pop(SkillResolverService.normalize(raw), None)
+        for name in [
+            name for name, (_, skill) in local.items()
+            if not SkillResolverService._is_exact(name, skill)
+        ]:
+            del local[name]
+
+    @staticmethod
+    def forget(names: list[str]):
+        SkillResolverService.forget_local(names)
+
+        keys = [
+            SkillResolverService.CACHE_KEY.format(name=SkillResolverService.normalize(raw))
+            for raw in names
+        ]
+        if keys:
+            redis_client.delete(*keys)
@@ -0,0 +1,76 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.posts import Post
+from app.models.skill_stats import SkillStats
+from app.models.user_skills import user_skills
+
+
+class SkillStatsService:
+
+    @staticmethod
+    def _apply(db: Session, deltas: dict[int, tuple[int, int]]):
+        # skill_id -> (accounts delta, posts delta), upserted in the
+        # caller's transaction so counters commit with the change itself.
+        rows = [
+            {"skill_id": skill_id, "total_accounts": accounts, "total_posts": posts}
+            for skill_id, (accounts, posts) in deltas.items()
+            if accounts or posts
+        ]
+        if not rows:
+            return
+
+        stmt = insert(SkillStats).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SkillStats.skill_id],
+            set_={
+                "total_accounts": SkillStats.total_accounts + stmt.excluded.total_accounts,
+                "total_posts": SkillStats.total_posts + stmt.excluded.total_posts,
+            }
+        )
+        db.execute(stmt)
+
+    @staticmethod
+    def on_user_skills_changed(
+        db: Session,
+        user,
+        added: set[int],
+        removed: set[int]
+    ):
+        if not added and not removed:
+            return
+
+        active_posts = (
+            db.query(func.count(Post.id))
+            .filter(Post.created_by == user.id, Post.is_active == True)
+            .scalar()
+        )
+        account = 1 if user.is_active else 0
+
+        deltas = {skill_id: (account, active_posts) for skill_id in added}
+        deltas.update({skill_id: (-account, -active_posts) for skill_id in removed})
+
+        SkillStatsService._apply(db, deltas)
+
+    @staticmethod
+    def on_post_created(db: Session, user_id: int):
+        skill_ids = (
+            db.query(user_skills.c.skill_id)
+            .filter(user_skills.c.user_id == user_id)
+            .distinct()
+            .all()
+        )
+
+        SkillStatsService._apply(
+            db, {skill_id: (0, 1) for (skill_id,) in skill_ids}
+        )
+
+    @staticmethod
+    def get(db: Session, skill_id: int) -> dict:
+        stats = db.get(SkillStats, skill_id)
+
+        return {
+            "total_accounts": stats.total_accounts if stats else 0,
+            "total_posts": stats.total_posts if stats else 0,
+        }
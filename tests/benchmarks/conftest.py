@@ -0,0 +1,76 @@
+import os
+import statistics
+import time
+import tracemalloc
+
+import pytest
+
+
+# Benchmarks are opt-in: RUN_BENCHMARKS=1 python -m pytest tests/benchmarks
+# Results are printed in the terminal summary. They only assert what the
+# change being measured claims (e.g. "fewer allocations"), never absolute
+# timings, so they stay meaningful on any machine.
+if not os.getenv("RUN_BENCHMARKS"):
+    collect_ignore_glob = ["test_*.py"]
+
+
+_results: list[tuple[str, str, str]] = []
+
+
+class Bench:
+    def __init__(self, group: str):
+        self.group = group
+
+    def record(self, label: str, text: str):
+        _results.append((self.group, label, text))
+
+    def time(self, label: str, fn, rounds: int = 50, warmup: int = 3) -> float:
+        """Median wall time per call in seconds; CPU time is reported too."""
+        for _ in range(warmup):
+            fn()
+
+        wall, cpu = [], []
+        for _ in range(rounds):
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            fn()
+            wall.append(time.perf_counter() - wall_start)
+            cpu.append(time.process_time() - cpu_start)
+
+        median = statistics.median(wall)
+        self.record(
+            label,
+            f"{median * 1e3:9.3f} ms wall  {statistics.median(cpu) * 1e3:9.3f} ms cpu"
+            f"  (median of {rounds})"
+        )
+        return median
+
+    def allocations(self, label: str, fn) -> int:
+        """Peak bytes allocated by Python during one call."""
+        fn()
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.record(label, f"{peak / 1024:9.1f} KiB peak allocated")
+        return peak
+
+
+@pytest.fixture
+def bench(request):
+    return Bench(request.node.name)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+
+    terminalreporter.section("benchmarks")
+    group = None
+    for name, label, text in _results:
+        if name != group:
+            terminalreporter.write_line(name)
+            group = name
+        terminalreporter.write_line(f"  {label:<40} {text}")
@@ -0,0 +1,90 @@
+"""
+The ORM-entity feed read path that FeedService.get_feed replaced, kept
+only as the baseline for the feed benchmarks: full Post / Users /
+PostImage entities (images joined eagerly, as the relationship used to
+be), copied into pydantic models and serialized by FastAPI's default
+response_model + jsonable_encoder path.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session, joinedload
+
+from app.models import Post
+
+
+class LegacyFeedCreator(BaseModel):
+    id: Optional[int]
+    username: Optional[str]
+    profile_photo: Optional[str]
+
+
+class LegacyFeedPost(BaseModel):
+    id: int
+    title: str
+    description: str
+    category: str
+    duration: Optional[str]
+    images: List[str]
+    creator: LegacyFeedCreator
+    created_at: datetime
+
+
+class LegacyFeedPagination(BaseModel):
+    limit: int
+    has_next: bool
+    next_cursor: Optional[str]
+
+
+class LegacyFeedResponse(BaseModel):
+    posts: List[LegacyFeedPost]
+    pagination: LegacyFeedPagination
+
+
+def get_feed(db: Session, limit: int) -> LegacyFeedResponse:
+    posts = (
+        db.query(Post)
+        .options(joinedload(Post.creator), joinedload(Post.images))
+        .filter(Post.is_active == True)
+        .order_by(Post.created_at.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    has_next = len(posts) > limit
+    posts = posts[:limit]
+
+    return LegacyFeedResponse(
+        posts=[
+            LegacyFeedPost(
+                id=post.id,
+                title=post.title,
+                description=post.description,
+                category=post.category,
+                duration=post.duration,
+                images=[image.image_url for image in post.images],
+                creator=LegacyFeedCreator(
+                    id=post.creator.id if post.creator else None,
+                    username=post.creator.username if post.creator else None,
+                    profile_photo=post.creator.profile_image if post.creator else None,
+                ),
+                created_at=post.created_at,
+            )
+            for post in posts
+        ],
+        pagination=LegacyFeedPagination(
+            limit=limit,
+            has_next=has_next,
+            next_cursor=posts[-1].created_at.isoformat() if has_next else None,
+        ),
+    )
+
+
+def render(page) -> bytes:
+    # What a route with response_model=LegacyFeedResponse did on return:
+    # validate the returned value, walk it with jsonable_encoder, json.dumps
+    validated = LegacyFeedResponse.model_validate(page, from_attributes=True)
+    return JSONResponse(jsonable_encoder(validated)).body
@@ -0,0 +1,34 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("jose")
+
+from app.core import jwt_utils
+from app.core.jwt_utils import create_access_token, decode_access_token, decode_access_token_cached
+from app.dependencies.auth import get_current_user
+
+
+def test_auth_overhead_per_request(bench):
+    token = create_access_token("user@example.com", 1, timedelta(minutes=30))
+    jwt_utils._access_cache.clear()
+
+    full = bench.time(
+        f"full verification ({jwt_utils.settings.JWT_BACKEND}, {jwt_utils.ALGORITHM})",
+        lambda: decode_access_token(token),
+        rounds=2000
+    )
+    cached = bench.time(
+        "cached claims, repeat token",
+        lambda: decode_access_token_cached(token),
+        rounds=2000
+    )
+    bench.time(
+        "get_current_user, repeat token",
+        lambda: asyncio.run(get_current_user(token)),
+        rounds=500
+    )
+
+    bench.record("speedup (verification vs cached)", f"{full / cached:9.1f}x")
+    assert cached < full
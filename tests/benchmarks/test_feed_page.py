@@ -0,0 +1,61 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+import legacy_feed
+from app.models import Post, Users
+from app.models.post_image import PostImage
+from app.services.feed_service import FeedService
+
+
+PAGE = 50
+
+
+@pytest.fixture
+def feed(db):
+    creators = [
+        Users(email=f"creator{i}@example.com", username=f"creator{i}", profile_image="https://img.example.com/u.png")
+        for i in range(10)
+    ]
+    db.add_all(creators)
+    db.flush()
+
+    start = datetime(2026, 1, 1)
+    for i in range(PAGE * 4):
+        post = Post(
+            title=f"Post {i}",
+            description="A description of moderate length. " * 5,
+            category="dev",
+            duration="2 weeks",
+            created_by=creators[i % len(creators)].id,
+            created_at=start + timedelta(minutes=i),
+        )
+        post.images = [
+            PostImage(image_url=f"https://img.example.com/{i}/{n}.png") for n in range(3)
+        ]
+        db.add(post)
+
+    db.commit()
+    return {"user_id": creators[0].id}
+
+
+def test_feed_page_cpu_and_allocations(db, feed, bench):
+    def legacy():
+        db.expunge_all()  # every request starts with an empty identity map
+        return legacy_feed.get_feed(db, PAGE)
+
+    def projected():
+        return FeedService.get_feed(None, PAGE, db, feed)
+
+    assert len(legacy().posts) == len(projected()["posts"]) == PAGE
+
+    bench.time(f"ORM entities, {PAGE} posts", legacy)
+    bench.time(f"column projection, {PAGE} posts", projected)
+    legacy_peak = bench.allocations(f"ORM entities, {PAGE} posts", legacy)
+    projected_peak = bench.allocations(f"column projection, {PAGE} posts", projected)
+
+    assert projected_peak < legacy_peak
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+import legacy_feed
+from app.core.responses import FastJSONResponse
+
+
+PAGE = 50
+
+
+def _feed_page() -> dict:
+    # Same shape FeedService.get_feed returns
+    start = datetime(2026, 1, 1)
+    return {
+        "posts": [
+            {
+                "id": i,
+                "title": f"Post {i}",
+                "description": "A description of moderate length. " * 5,
+                "category": "dev",
+                "duration": "2 weeks",
+                "images": [f"https://img.example.com/{i}/{n}.png" for n in range(3)],
+                "creator": {
+                    "id": i % 10,
+                    "username": f"creator{i % 10}",
+                    "profile_photo": "https://img.example.com/u.png",
+                },
+                "created_at": start + timedelta(minutes=i),
+            }
+            for i in range(PAGE)
+        ],
+        "pagination": {"limit": PAGE, "has_next": True, "next_cursor": "2026-01-01T00:49:00|49"},
+    }
+
+
+def test_feed_page_serialization(bench):
+    page = _feed_page()
+
+    legacy = bench.time(
+        f"response_model + jsonable_encoder, {PAGE} posts",
+        lambda: legacy_feed.render(page),
+        rounds=200
+    )
+    fast = bench.time(
+        f"FastJSONResponse (orjson), {PAGE} posts",
+        lambda: FastJSONResponse(page).body,
+        rounds=200
+    )
+
+    bench.record("speedup", f"{legacy / fast:9.1f}x")
+    assert fast < legacy
@@ -0,0 +1,66 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+pytest.importorskip("passlib")
+
+from app.core import hashing
+from app.core.hashing import Hash
+
+
+CONCURRENT_LOGINS = 32
+
+
+def _worker_counts() -> list[int]:
+    cores = os.cpu_count() or 1
+    counts, n = [], 1
+    while n < cores:
+        counts.append(n)
+        n *= 2
+    return counts + [cores]
+
+
+async def _verify_in_pool(hashed: str, n: int):
+    await asyncio.gather(*(Hash.verify_async("correct horse", hashed) for _ in range(n)))
+
+
+async def _verify_on_loop(hashed: str, n: int):
+    # The path before the pool: bcrypt inline in the async handler
+    async def login():
+        return Hash.verify("correct horse", hashed)
+
+    await asyncio.gather(*(login() for _ in range(n)))
+
+
+def _throughput(coro_factory) -> float:
+    start = time.perf_counter()
+    asyncio.run(coro_factory())
+    return CONCURRENT_LOGINS / (time.perf_counter() - start)
+
+
+def test_login_hash_throughput_scales_with_cores(bench, monkeypatch):
+    # Password verification is the CPU-bound part of AuthService.login
+    hashed = Hash.hash("correct horse")
+
+    inline = _throughput(lambda: _verify_on_loop(hashed, CONCURRENT_LOGINS))
+    bench.record("inline on the event loop", f"{inline:9.1f} logins/s")
+
+    results = {}
+    for workers in _worker_counts():
+        hashing.shutdown_pool()
+        monkeypatch.setattr(hashing.settings, "PASSWORD_HASH_WORKERS", workers)
+        hashing.start_pool()
+        asyncio.run(_verify_in_pool(hashed, workers))  # spawn the workers
+
+        results[workers] = _throughput(
+            lambda: _verify_in_pool(hashed, CONCURRENT_LOGINS)
+        )
+        bench.record(f"process pool, {workers} workers", f"{results[workers]:9.1f} logins/s")
+
+    hashing.shutdown_pool()
+
+    most = max(results)
+    if most > 1:
+        assert results[most] > results[1] * 1.5
@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+from sqlalchemy import or_, text
+
+from app.models import Post, Users
+from app.services.search_service import SearchService
+
+
+# 1M by default, as in the request; BENCH_POSTS=100000 for a quick run
+POSTS = int(os.getenv("BENCH_POSTS", "1000000"))
+
+WORDS = [
+    "react", "native", "python", "django", "postgres", "design", "figma",
+    "rust", "kotlin", "swift", "marketing", "video", "editing", "startup",
+    "mentor", "backend", "frontend", "data", "science", "machine",
+    "learning", "cloud", "devops", "security", "writing", "music",
+]
+
+
+@pytest.fixture
+def corpus(db):
+    db.add(Users(email="bench@example.com", username="bench"))
+    db.flush()
+
+    # Server-side generation: titles / descriptions are random picks from
+    # WORDS, so every query term matches a realistic fraction of rows
+    db.execute(text("""
+        INSERT INTO posts (title, description, category, created_by, created_at, is_active, application_count)
+        SELECT
+            w[1 + (random() * (cardinality(w) - 1))::int] || ' ' ||
+            w[1 + (random() * (cardinality(w) - 1))::int],
+            (SELECT string_agg(w[1 + (random() * (cardinality(w) - 1))::int], ' ')
+             FROM generate_series(1, 20 + g % 7)),
+            w[1 + (g % cardinality(w))],
+            (SELECT id FROM users WHERE username = 'bench'),
+            now() - (g || ' seconds')::interval,
+            g % 10 <> 0,
+            0
+        FROM generate_series(1, :n) AS g, (SELECT CAST(:words AS text[]) AS w) AS words
+    """), {"n": POSTS, "words": WORDS})
+
+    # Same index as migration 5ac3e8f21b96, built after the bulk load
+    db.execute(text(
+        "CREATE INDEX idx_posts_search_vector ON posts USING gin (search_vector)"
+    ))
+    db.execute(text("ANALYZE posts"))
+
+
+def _ilike_baseline(db, query: str, limit: int):
+    # What searching posts costs without the tsvector column
+    pattern = f"%{query}%"
+    return (
+        db.query(Post.id)
+        .filter(
+            or_(Post.title.ilike(pattern), Post.description.ilike(pattern)),
+            Post.is_active == True
+        )
+        .order_by(Post.created_at.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+@pytest.mark.parametrize("query", ["react native", "machine learning security"])
+def test_post_search(db, corpus, bench, query):
+    first = SearchService.search_posts(db, query, limit=20)
+    cursor = first["pagination"]["next_cursor"]
+
+    bench.time(
+        "search_posts page 1",
+        lambda: SearchService.search_posts(db, query, limit=20),
+        rounds=10
+    )
+    bench.time(
+        "search_posts page 2 (cursor)",
+        lambda: SearchService.search_posts(db, query, cursor=cursor, limit=20),
+        rounds=10
+    )
+    bench.time(
+        "search_posts with category filter",
+        lambda: SearchService.search_posts(db, query, category="design", limit=20),
+        rounds=10
+    )
+    bench.time(
+        "ILIKE scan (no index)",
+        lambda: _ilike_baseline(db, query.split()[0], 20),
+        rounds=3,
+        warmup=1
+    )
+
+    plan = "\n".join(db.execute(text(
+        "EXPLAIN SELECT id FROM posts "
+        "WHERE search_vector @@ websearch_to_tsquery('english', :q)"
+    ), {"q": query}).scalars())
+
+    bench.record("posts", f"{POSTS:,}")
+    assert "idx_posts_search_vector" in plan
+    assert len(first["posts"]) == 20
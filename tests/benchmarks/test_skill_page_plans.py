@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+from sqlalchemy import text
+
+from app.models.user_skills import user_skills
+from app.services.skill_detail_service import SkillDetailService
+
+
+# 1M user_skills rows by default, as in the request
+USERS = int(os.getenv("BENCH_USERS", "100000"))
+SKILLS_PER_USER = int(os.getenv("BENCH_SKILLS_PER_USER", "10"))
+SKILLS = 5000
+
+
+@pytest.fixture
+def associations(db):
+    db.execute(text("""
+        INSERT INTO skills (id, name)
+        SELECT g, 'skill ' || g FROM generate_series(1, :skills) AS g
+    """), {"skills": SKILLS})
+    db.execute(text("""
+        INSERT INTO users (id, email, username, is_active, is_verified)
+        SELECT g, 'user' || g || '@example.com', 'user' || g, true, true
+        FROM generate_series(1, :users) AS g
+    """), {"users": USERS})
+    # Skewed popularity: low skill ids are shared by many users
+    db.execute(text("""
+        INSERT INTO user_skills (user_id, skill_id)
+        SELECT DISTINCT u, 1 + floor(:skills * power(random(), 3))::int
+        FROM generate_series(1, :users) AS u, generate_series(1, :per_user)
+    """), {"users": USERS, "skills": SKILLS, "per_user": SKILLS_PER_USER})
+    db.execute(text("""
+        INSERT INTO posts (title, description, category, created_by, created_at, is_active, application_count)
+        SELECT 'Post ' || g, 'description', 'dev', 1 + g % :users, now() - (g || ' minutes')::interval, true, 0
+        FROM generate_series(1, :users / 2) AS g
+    """), {"users": USERS})
+    db.execute(text("ANALYZE users; ANALYZE skills; ANALYZE user_skills; ANALYZE posts"))
+
+    return db.execute(text("SELECT count(*) FROM user_skills")).scalar()
+
+
+def _plan(db, query) -> str:
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    return "\n".join(db.connection().exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS) {compiled}", compiled.params
+    ).scalars().all())
+
+
+def _measure(db, bench, phase: str, skill_id: int) -> dict:
+    queries = {
+        "accounts": lambda: SkillDetailService._skill_accounts_query(db, skill_id).limit(20),
+        "posts": lambda: SkillDetailService._skill_posts_query(db, skill_id).limit(20),
+        # The shape of the Users.skills selectin load
+        "user's skills": lambda: db.query(user_skills.c.skill_id).filter(user_skills.c.user_id.in_([4242])),
+    }
+
+    plans = {}
+    for name, query in queries.items():
+        bench.time(f"{phase}: {name}", lambda: query().all(), rounds=20)
+        plans[name] = _plan(db, query())
+        scans = [line.strip() for line in plans[name].splitlines() if "on user_skills" in line]
+        bench.record(f"{phase}: {name} plan", "; ".join(scans))
+    return plans
+
+
+@pytest.mark.parametrize("skill_id", [1, SKILLS // 2], ids=["popular skill", "rare skill"])
+def test_skill_page_plans_before_and_after(db, associations, bench, skill_id):
+    bench.record("user_skills rows", f"{associations:,}")
+
+    after = _measure(db, bench, "with keys", skill_id)
+
+    db.execute(text("""
+        DROP INDEX ix_user_skills_skill_id_user_id;
+        ALTER TABLE user_skills DROP CONSTRAINT user_skills_pkey;
+        ANALYZE user_skills;
+    """))
+    before = _measure(db, bench, "no keys", skill_id)
+
+    assert "ix_user_skills_skill_id_user_id" in after["accounts"] + after["posts"]
+    assert "user_skills_pkey" in after["user's skills"]
+    assert "Seq Scan on user_skills" in before["user's skills"]
@@ -0,0 +1,143 @@
+import importlib.util
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+
+# The suite runs against a throwaway Postgres database (the queries under
+# test use array_agg, tsvector and partial indexes). Every table in it is
+# dropped and recreated. Test modules skip themselves when this is unset.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Settings() requires all of these; the tests only use the database
+for name, value in {
+    "DATABASE_URL": TEST_DATABASE_URL or "postgresql://localhost/unused",
+    "SECRET_KEY": "test-secret",
+    "ALGORITHM": "HS256",
+    "REDIRECT_URI": "http://localhost",
+    "GOOGLE_CLIENT_ID": "test",
+    "GOOGLE_CLIENT_SECRET": "test",
+    "GITHUB_CLIENT_ID": "test",
+    "GITHUB_CLIENT_SECRET": "test",
+    "EMAIL_FROM": "test@example.com",
+    "EMAIL_PASSWORD": "test",
+    "EMAIL_HOST": "localhost",
+    "EMAIL_PORT": "25",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "CLOUDINARY_CLOUD_NAME": "test",
+    "CLOUDINARY_API_KEY": "test",
+    "CLOUDINARY_API_SECRET": "test",
+    "ALLOWED_ORIGINS": "http://localhost",
+}.items():
+    os.environ.setdefault(name, value)
+
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+
+def _apply_migration(connection, revision: str):
+    # Runs one revision's upgrade() on the connection, for objects that
+    # only exist in migrations (e.g. partial indexes)
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    path = next((ROOT / "alembic" / "versions").glob(f"{revision}_*.py"))
+    spec = importlib.util.spec_from_file_location(f"migration_{revision}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    with Operations.context(MigrationContext.configure(connection)):
+        module.upgrade()
+
+
+@pytest.fixture(scope="session")
+def engine():
+    import app.models  # noqa: F401  (registers every table on Base)
+    from app.database import Base, engine
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        _apply_migration(connection, "3f7a2c91d4e8")
+
+    yield engine
+
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def db(engine):
+    # Each test runs in a transaction that is rolled back; commits inside
+    # the test only release a savepoint
+    from app.database import SessionLocal
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def migrate():
+    """migrate(connection, revision) runs that revision's upgrade()."""
+    return _apply_migration
+
+
+@pytest.fixture
+def explain(db):
+    """explain(query) -> plan text of an ORM query, sequential scans off."""
+    from sqlalchemy import text
+
+    def explain(query) -> str:
+        # Tiny test tables would otherwise always be sequentially scanned
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+
+        compiled = query.statement.compile(dialect=db.get_bind().dialect)
+        plan = db.connection().exec_driver_sql(
+            f"EXPLAIN {compiled}", compiled.params
+        ).scalars().all()
+        return "\n".join(plan)
+
+    return explain
+
+
+@pytest.fixture
+def assert_queries(engine):
+    """
+    with assert_queries(2): ...  fails unless exactly 2 statements hit the
+    database inside the block. Savepoint bookkeeping is not counted.
+    """
+    from sqlalchemy import event
+
+    @contextmanager
+    def assert_queries(expected: int):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if not statement.lstrip().upper().startswith(
+                ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+            ):
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == expected, (
+            f"expected {expected} queries, got {len(statements)}:\n\n"
+            + "\n\n".join(statements)
+        )
+
+    return assert_queries
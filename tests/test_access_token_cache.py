@@ -0,0 +1,89 @@
+import time
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("jose")
+pytest.importorskip("pydantic_settings")
+
+from fastapi import HTTPException
+
+from app.core import jwt_utils
+from app.core.jwt_utils import create_access_token, decode_access_token_cached
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    jwt_utils._access_cache.clear()
+    yield
+    jwt_utils._access_cache.clear()
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    # Counts full signature verifications behind the cache
+    calls = []
+    original = jwt_utils.decode_access_token
+
+    def counting(token):
+        calls.append(token)
+        return original(token)
+
+    monkeypatch.setattr(jwt_utils, "decode_access_token", counting)
+    return calls
+
+
+def _token(user_id: int, minutes: int = 30) -> str:
+    return create_access_token(f"user{user_id}@example.com", user_id, timedelta(minutes=minutes))
+
+
+def test_repeat_token_is_verified_once(decodes):
+    token = _token(1)
+
+    first = decode_access_token_cached(token)
+    second = decode_access_token_cached(token)
+
+    assert first == second
+    assert first["user_id"] == 1
+    assert len(decodes) == 1
+
+
+def test_entry_is_not_served_past_token_exp(decodes, monkeypatch):
+    token = _token(1)
+    claims = decode_access_token_cached(token)
+
+    # The clock reaches exp: the cached claims must not be used again
+    real_time = time.time
+    monkeypatch.setattr(jwt_utils.time, "time", lambda: claims["exp"] + 1)
+    decode_access_token_cached(token)
+    monkeypatch.setattr(jwt_utils.time, "time", real_time)
+
+    assert len(decodes) == 2
+
+
+def test_expired_token_is_rejected_and_not_cached():
+    token = _token(1, minutes=-1)
+
+    with pytest.raises(HTTPException) as error:
+        decode_access_token_cached(token)
+
+    assert error.value.status_code == 401
+    assert not jwt_utils._access_cache
+
+
+def test_least_recently_used_token_is_evicted(decodes, monkeypatch):
+    monkeypatch.setattr(jwt_utils.settings, "ACCESS_TOKEN_CACHE_SIZE", 2)
+    a, b, c = _token(1), _token(2), _token(3)
+
+    decode_access_token_cached(a)
+    decode_access_token_cached(b)
+    decode_access_token_cached(a)  # a is now the most recently used
+    decode_access_token_cached(c)  # evicts b
+
+    assert len(jwt_utils._access_cache) == 2
+    assert decodes == [a, b, c]
+
+    decode_access_token_cached(a)
+    decode_access_token_cached(b)
+
+    assert decodes == [a, b, c, b]
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+pytest.importorskip("redis")
+pytest.importorskip("pydantic_settings")
+
+from app.core import autocomplete_cache
+from app.core.autocomplete_cache import AutocompleteCache
+
+
+class FakeRedis:
+    # The four commands AutocompleteCache uses, decode_responses=True style
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.mget_calls = 0
+
+    def mget(self, keys):
+        self.mget_calls += 1
+        return [self.values.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    def hincrby(self, key, field, amount):
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(autocomplete_cache, "redis_client", fake)
+    return fake
+
+
+@pytest.fixture
+def cache(redis):
+    return AutocompleteCache("category", ttl=300, empty_ttl=60, min_length=3)
+
+
+def test_miss_then_exact_hit(cache, redis):
+    assert cache.get("React") is None
+
+    cache.set("React", ["react", "react native"], limit=8)
+
+    assert cache.get("react") == ["react", "react native"]
+    assert redis.ttls["autocomplete:category:react"] == 300
+    assert cache.metrics() == {"hit": 1, "derived": 0, "miss": 1, "hit_ratio": 0.5}
+
+
+def test_longer_query_is_derived_from_cached_prefix(cache, redis):
+    cache.set("rea", ["Area", "React", "Reason", "Preact"], limit=8)
+
+    # One MGET covers the exact key and every prefix down to min_length
+    assert cache.get("reac") == ["React", "Preact"]
+    assert redis.mget_calls == 1
+
+    # The derived answer is stored under its own key
+    stored = json.loads(redis.values["autocomplete:category:reac"])
+    assert stored == {"results": ["React", "Preact"], "truncated": False}
+    assert cache.metrics()["derived"] == 1
+
+
+def test_longest_prefix_wins(cache):
+    cache.set("rea", ["Area", "React"], limit=8)
+    cache.set("reac", ["React"], limit=8)
+
+    assert cache.get("react") == ["React"]
+
+
+def test_truncated_prefix_is_not_used(cache):
+    # Hit the limit: names containing "react" may have been cut off
+    cache.set("rea", ["Area", "Reason"], limit=2)
+
+    assert cache.get("react") is None
+    assert cache.metrics()["miss"] == 1
+
+
+def test_prefixes_stop_at_min_length(cache, redis):
+    redis.values["autocomplete:category:re"] = json.dumps(
+        {"results": ["React"], "truncated": False}
+    )
+
+    assert cache.get("react") is None
+
+
+def test_empty_results_are_cached_with_short_ttl(cache, redis):
+    cache.set("zzz", [], limit=8)
+
+    assert cache.get("zzz") == []
+    assert redis.ttls["autocomplete:category:zzz"] == 60
+    assert cache.metrics()["hit"] == 1
+
+
+def test_empty_prefix_answers_longer_queries(cache):
+    cache.set("zzz", [], limit=8)
+
+    assert cache.get("zzzz") == []
+
+
+def test_names_with_commas_round_trip(cache):
+    cache.set("r&d", ["R&D, Europe", "R&D"], limit=8)
+
+    assert cache.get("r&d") == ["R&D, Europe", "R&D"]
+
+
+def test_metrics_without_traffic(cache):
+    assert cache.metrics() == {"hit": 0, "derived": 0, "miss": 0, "hit_ratio": None}
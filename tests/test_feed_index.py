@@ -0,0 +1,83 @@
+import os
+from datetime import datetime
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+from app.models import Post, Users
+from app.services.feed_service import FeedService
+
+
+@pytest.fixture
+def author(db):
+    user = Users(email="feed@example.com", username="feed")
+    db.add(user)
+    db.flush()
+    return user
+
+
+def _add_posts(db, author, created_at: datetime, count: int, is_active: bool = True):
+    db.add_all([
+        Post(
+            title="Post",
+            description="description",
+            category="dev",
+            created_by=author.id,
+            created_at=created_at,
+            is_active=is_active,
+        )
+        for _ in range(count)
+    ])
+    db.flush()
+
+
+def _feed_ids_query(db, cursor=None):
+    # The filter / order / cursor of FeedService.get_feed, without the
+    # per-row columns that do not affect index choice
+    query = db.query(Post.id).filter(Post.is_active == True)
+    return (
+        FeedService._apply_cursor(query, cursor)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(20)
+    )
+
+
+def test_feed_first_page_scans_partial_index(db, author, explain):
+    _add_posts(db, author, datetime(2026, 1, 1), 50)
+    _add_posts(db, author, datetime(2026, 1, 2), 50, is_active=False)
+
+    plan = explain(_feed_ids_query(db))
+
+    assert "idx_posts_active_feed" in plan
+    assert "Sort" not in plan
+
+
+def test_feed_cursor_is_an_index_range(db, author, explain):
+    _add_posts(db, author, datetime(2026, 1, 1), 50)
+
+    plan = explain(_feed_ids_query(db, cursor="2026-01-01T00:00:00|25"))
+
+    assert "idx_posts_active_feed" in plan
+    assert "Sort" not in plan
+    # The row comparison is the index condition, not a post-scan filter
+    assert "Index Cond: (ROW(created_at, id) < ROW(" in plan
+
+
+def test_feed_pages_through_identical_timestamps(db, author):
+    _add_posts(db, author, datetime(2026, 1, 1), 7)
+    expected = [
+        post_id for (post_id,) in
+        db.query(Post.id).order_by(Post.id.desc()).all()
+    ]
+
+    seen, cursor = [], None
+    while True:
+        page = FeedService.get_feed(cursor, 3, db, {"user_id": author.id})
+        seen += [post["id"] for post in page["posts"]]
+        if not page["pagination"]["has_next"]:
+            break
+        cursor = page["pagination"]["next_cursor"]
+
+    assert seen == expected
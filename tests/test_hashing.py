@@ -0,0 +1,76 @@
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+pytest.importorskip("passlib")
+pytest.importorskip("pydantic_settings")
+
+from app.core import hashing
+from app.core.hashing import Hash
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    hashing.shutdown_pool()
+    yield
+    hashing.shutdown_pool()
+
+
+def test_pool_size_setting_wins(monkeypatch):
+    monkeypatch.setattr(hashing.settings, "PASSWORD_HASH_WORKERS", 3)
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+
+    assert hashing._pool_size() == 3
+
+
+@pytest.mark.parametrize("web_workers, expected", [(None, 8), ("1", 8), ("4", 2), ("16", 1)])
+def test_pool_size_shares_cores_between_web_workers(monkeypatch, web_workers, expected):
+    monkeypatch.setattr(hashing.settings, "PASSWORD_HASH_WORKERS", 0)
+    monkeypatch.setattr(hashing.os, "cpu_count", lambda: 8)
+    if web_workers is None:
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    else:
+        monkeypatch.setenv("WEB_CONCURRENCY", web_workers)
+
+    assert hashing._pool_size() == expected
+
+
+def test_hash_and_verify_run_in_worker_processes():
+    async def scenario():
+        hashed = await Hash.hash_async("correct horse")
+        return (
+            await Hash.verify_async("correct horse", hashed),
+            await Hash.verify_async("wrong horse", hashed),
+            await hashing._run(os.getpid),
+        )
+
+    valid, invalid, worker_pid = asyncio.run(scenario())
+
+    assert valid and not invalid
+    assert worker_pid != os.getpid()
+
+
+class _BrokenPool:
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("a worker died")
+
+    def shutdown(self, *args, **kwargs):
+        self.shut_down = True
+
+
+def test_broken_pool_is_replaced_and_call_retried(monkeypatch):
+    broken = _BrokenPool()
+    monkeypatch.setattr(hashing, "_pool", broken)
+
+    worker_pid = asyncio.run(hashing._run(os.getpid))
+
+    assert worker_pid != os.getpid()
+    assert broken.shut_down
+    assert hashing._pool is not broken
+
+    hashing.shutdown_pool()
@@ -0,0 +1,135 @@
+import base64
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("cryptography")
+pytest.importorskip("jose")
+pytest.importorskip("pydantic_settings")
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from jose import JWTError, jwt
+
+from app.core import jwt_utils
+from app.core.jwt_keys import JWTKeySet
+
+
+def _b64url_decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _write_private(path, key):
+    path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ))
+
+
+def _write_public(path, key):
+    path.write_bytes(key.public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo
+    ))
+
+
+@pytest.fixture
+def rsa_keys(tmp_path):
+    # "new" signs; "old" is a retired key kept for verification only
+    new = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    old = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    _write_private(tmp_path / "new.pem", new)
+    _write_public(tmp_path / "old.pub.pem", old.public_key())
+
+    return JWTKeySet(str(tmp_path), "new", "RS256"), new, old
+
+
+def test_rsa_jwks_publishes_modulus_and_exponent(rsa_keys):
+    key_set, new, old = rsa_keys
+
+    jwks = {jwk["kid"]: jwk for jwk in key_set.jwks()["keys"]}
+
+    assert set(jwks) == {"new", "old"}
+    for kid, key in (("new", new), ("old", old)):
+        numbers = key.public_key().public_numbers()
+        assert jwks[kid]["kty"] == "RSA"
+        assert jwks[kid]["alg"] == "RS256"
+        assert "=" not in jwks[kid]["n"]
+        assert int.from_bytes(_b64url_decode(jwks[kid]["n"]), "big") == numbers.n
+        assert int.from_bytes(_b64url_decode(jwks[kid]["e"]), "big") == numbers.e == 65537
+
+
+def test_ed25519_jwks_publishes_raw_public_key(tmp_path):
+    key = ed25519.Ed25519PrivateKey.generate()
+    _write_private(tmp_path / "ed.pem", key)
+
+    (jwk,) = JWTKeySet(str(tmp_path), "ed", "EdDSA").jwks()["keys"]
+
+    raw = key.public_key().public_bytes(
+        serialization.Encoding.Raw,
+        serialization.PublicFormat.Raw
+    )
+    assert jwk["kty"] == "OKP"
+    assert jwk["crv"] == "Ed25519"
+    assert jwk["kid"] == "ed"
+    assert _b64url_decode(jwk["x"]) == raw
+
+
+def test_verification_key_is_selected_by_kid(rsa_keys):
+    key_set, new, old = rsa_keys
+
+    assert key_set.verification_key("old", as_pem=False).public_numbers() == \
+        old.public_key().public_numbers()
+    assert key_set.verification_key("new", as_pem=False).public_numbers() == \
+        new.public_key().public_numbers()
+    assert key_set.verification_key("missing", as_pem=True) is None
+    assert key_set.verification_key(None, as_pem=True) is None
+
+
+def test_active_kid_without_private_key_fails(tmp_path):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    _write_public(tmp_path / "old.pub.pem", key.public_key())
+
+    with pytest.raises(RuntimeError):
+        JWTKeySet(str(tmp_path), "old", "RS256")
+
+
+@pytest.fixture
+def signing_with(monkeypatch, rsa_keys):
+    key_set = rsa_keys[0]
+    monkeypatch.setattr(jwt_utils, "ALGORITHM", "RS256")
+    monkeypatch.setattr(jwt_utils, "key_set", key_set)
+    monkeypatch.setattr(jwt_utils, "_USE_PEM", True)
+    monkeypatch.setattr(jwt_utils.settings, "JWT_BACKEND", "jose")
+    return key_set
+
+
+def test_tokens_carry_kid_and_verify(signing_with):
+    token = jwt_utils.create_access_token("a@example.com", 1, timedelta(minutes=5))
+
+    assert jwt.get_unverified_header(token)["kid"] == "new"
+    assert jwt_utils.verify_token(token)["user_id"] == 1
+
+
+def test_token_from_retired_key_still_verifies(signing_with, rsa_keys):
+    old = rsa_keys[2]
+    token = jwt.encode(
+        {"type": "access", "user_id": 2},
+        old.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ).decode(),
+        algorithm="RS256",
+        headers={"kid": "old"}
+    )
+
+    assert jwt_utils.verify_token(token)["user_id"] == 2
+
+
+def test_unknown_kid_is_rejected(signing_with):
+    token = jwt.encode({"type": "access"}, "secret", algorithm="HS256", headers={"kid": "gone"})
+
+    with pytest.raises(JWTError, match="Unknown signing key"):
+        jwt_utils._verification_key(token)
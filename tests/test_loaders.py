@@ -0,0 +1,82 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+from app.models import Post, Skills, Users
+from app.models.post_image import PostImage
+from app.services.post_service import PostService
+from app.services.skill_detail_service import SkillDetailService
+from app.services.skill_resolver_service import SkillResolverService
+
+
+POSTS = 25
+IMAGES_PER_POST = 3
+
+
+@pytest.fixture
+def author(db):
+    user = Users(
+        email="author@example.com",
+        username="author",
+        first_name="Ada",
+        last_name="Lovelace",
+    )
+    user.skills = [Skills(name="python"), Skills(name="sql")]
+    db.add(user)
+    db.flush()
+
+    start = datetime(2026, 1, 1)
+    for i in range(POSTS):
+        post = Post(
+            title=f"Post {i}",
+            description="description",
+            category="dev",
+            created_by=user.id,
+            created_at=start + timedelta(minutes=i),
+        )
+        post.images = [
+            PostImage(image_url=f"https://img.example.com/{i}/{n}.png")
+            for n in range(IMAGES_PER_POST)
+        ]
+        db.add(post)
+
+    db.commit()
+    user_id = user.id
+    skill_id = user.skills[0].id
+    db.expunge_all()
+
+    return {"user_id": user_id, "skill_id": skill_id}
+
+
+@pytest.mark.parametrize("limit", [1, 10, 20])
+def test_get_my_posts_runs_fixed_queries(db, author, assert_queries, limit):
+    # Posts page + one selectin load for all of its images
+    with assert_queries(2):
+        posts = PostService.get_my_posts(db, author["user_id"], limit=limit)
+
+    assert len(posts) == limit
+    assert len({post.id for post in posts}) == limit
+    assert all(len(post.images) == IMAGES_PER_POST for post in posts)
+
+
+@pytest.mark.parametrize("limit", [1, 10, 20])
+def test_get_skill_posts_runs_fixed_queries(db, author, assert_queries, monkeypatch, limit):
+    # Resolution is cached in Redis / in-process, not what is measured here
+    monkeypatch.setattr(
+        SkillResolverService,
+        "resolve",
+        lambda db, name: {"id": author["skill_id"], "name": "python"}
+    )
+
+    # skill_stats lookup + one projected posts query
+    with assert_queries(2):
+        result = SkillDetailService.get_skill_posts(db, "python", limit=limit)
+
+    posts = result["posts"]
+    assert len(posts) == limit
+    assert len({post["id"] for post in posts}) == limit
+    assert all(post["creator"]["id"] == author["user_id"] for post in posts)
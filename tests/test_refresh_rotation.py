@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("jose")
+pytest.importorskip("passlib")
+pytest.importorskip("pydantic_settings")
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis runs the Lua rotation script with it
+
+from fastapi import HTTPException
+
+from app.core.jwt_utils import create_refresh_token, verify_token
+from app.models.users import Users
+from app.services import auth_service
+from app.services.auth_service import AuthService
+
+
+USER = Users(id=1, email="rotate@example.com", username="rotate")
+
+
+class _Db:
+    # refresh_access_token only looks the user up by id
+    def query(self, model):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def first(self):
+        return USER
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(auth_service, "redis_client", fake)
+    monkeypatch.setattr(
+        auth_service,
+        "_rotate_refresh_family",
+        fake.register_script(auth_service._rotate_refresh_family.script)
+    )
+    return fake
+
+
+def _refresh(token: str) -> dict:
+    return AuthService.refresh_access_token(token, _Db())
+
+
+def _family_key(token: str) -> str:
+    return AuthService.REFRESH_FAMILY_KEY.format(family=verify_token(token)["fam"])
+
+
+def test_rotation_moves_family_to_new_jti(redis):
+    token = AuthService._start_refresh_family(USER)
+
+    rotated = _refresh(token)["refresh_token"]
+
+    assert verify_token(rotated)["fam"] == verify_token(token)["fam"]
+    assert redis.hget(_family_key(token), "jti") == verify_token(rotated)["jti"]
+    assert redis.ttl(_family_key(token)) > 0
+
+    # The rotated token keeps working
+    assert _refresh(rotated)["refresh_token"]
+
+
+def test_replay_revokes_whole_family(redis):
+    token = AuthService._start_refresh_family(USER)
+    rotated = _refresh(token)["refresh_token"]
+
+    with pytest.raises(HTTPException) as replay:
+        _refresh(token)
+
+    assert replay.value.status_code == 401
+    assert "reuse" in replay.value.detail
+    assert not redis.exists(_family_key(token))
+
+    # The legitimate holder is logged out as well
+    with pytest.raises(HTTPException) as after:
+        _refresh(rotated)
+    assert after.value.status_code == 401
+
+
+def test_unknown_family_is_rejected(redis):
+    token = create_refresh_token(
+        USER.email, USER.id, timedelta(days=7), jti="jti", family="unknown"
+    )
+
+    with pytest.raises(HTTPException) as error:
+        _refresh(token)
+
+    assert error.value.status_code == 401
+
+
+def test_expired_family_is_rejected(redis):
+    token = AuthService._start_refresh_family(USER)
+    redis.delete(_family_key(token))
+
+    with pytest.raises(HTTPException) as error:
+        _refresh(token)
+
+    assert error.value.status_code == 401
+
+
+def test_legacy_token_moves_onto_a_family(redis):
+    legacy = create_refresh_token(USER.email, USER.id, timedelta(days=7), jti="legacy")
+    assert "fam" not in verify_token(legacy)
+
+    migrated = _refresh(legacy)["refresh_token"]
+
+    assert redis.exists(_family_key(migrated))
+    assert redis.hget(_family_key(migrated), "jti") == verify_token(migrated)["jti"]
+    assert redis.exists("blacklisted_jti:legacy")
+
+    # The legacy token itself is one-shot
+    with pytest.raises(HTTPException) as replay:
+        _refresh(legacy)
+    assert replay.value.status_code == 401
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+from sqlalchemy import select, text
+
+from app.models import Skills, Users
+from app.models.user_skills import user_skills
+from app.services.skill_detail_service import SkillDetailService
+
+
+@pytest.fixture
+def skill(db):
+    skill = Skills(name="python")
+    users = [Users(email=f"user{i}@example.com", username=f"user{i}") for i in range(20)]
+    for user in users:
+        user.skills = [skill]
+    db.add_all(users)
+    db.flush()
+    return skill
+
+
+def test_skill_accounts_use_reverse_index(db, skill, explain):
+    plan = explain(SkillDetailService._skill_accounts_query(db, skill.id).limit(20))
+
+    assert "ix_user_skills_skill_id_user_id" in plan
+
+
+def test_skill_posts_use_reverse_index(db, skill, explain):
+    plan = explain(SkillDetailService._skill_posts_query(db, skill.id).limit(20))
+
+    assert "ix_user_skills_skill_id_user_id" in plan
+
+
+def test_user_skills_load_uses_primary_key(db, skill, explain):
+    # The shape of the Users.skills selectin load
+    query = db.query(user_skills.c.skill_id).filter(user_skills.c.user_id.in_([1, 2, 3]))
+
+    assert "user_skills_pkey" in explain(query)
+
+
+def test_migration_deduplicates_and_adds_keys(db, migrate):
+    connection = db.connection()
+
+    # The table as it was before the migration: no keys, nullable columns
+    connection.execute(text("""
+        DROP INDEX ix_user_skills_skill_id_user_id;
+        ALTER TABLE user_skills DROP CONSTRAINT user_skills_pkey;
+        ALTER TABLE user_skills ALTER COLUMN user_id DROP NOT NULL;
+        ALTER TABLE user_skills ALTER COLUMN skill_id DROP NOT NULL;
+    """))
+
+    user = Users(email="dup@example.com", username="dup")
+    skill = Skills(name="rust")
+    db.add_all([user, skill])
+    db.flush()
+
+    connection.execute(user_skills.insert(), [
+        {"user_id": user.id, "skill_id": skill.id},
+        {"user_id": user.id, "skill_id": skill.id},
+        {"user_id": user.id, "skill_id": skill.id},
+        {"user_id": user.id, "skill_id": None},
+        {"user_id": None, "skill_id": skill.id},
+    ])
+
+    migrate(connection, "c3a9e5f17d40")
+
+    rows = connection.execute(select(user_skills)).all()
+    assert rows == [(user.id, skill.id)]
+
+    constraints = connection.execute(text(
+        "SELECT conname FROM pg_constraint "
+        "WHERE conrelid = 'user_skills'::regclass AND contype = 'p'"
+    )).scalars().all()
+    indexes = connection.execute(text(
+        "SELECT indexname FROM pg_indexes WHERE tablename = 'user_skills'"
+    )).scalars().all()
+
+    assert constraints == ["user_skills_pkey"]
+    assert "ix_user_skills_skill_id_user_id" in indexes